@@ -4,7 +4,28 @@ Configuration management for HUD Notes
 
 import json
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+
+
+# Built-in color schemes, shared by the settings dialog and scheme application
+COLOR_SCHEMES: Dict[str, Dict[str, str]] = {
+    'Matrix Green': {'bg': '#0a0a0a', 'fg': '#00ff41', 'accent': '#ff6600', 'select': '#1a3d1a'},
+    'Cyber Blue': {'bg': '#0a0a1a', 'fg': '#00ccff', 'accent': '#ff6600', 'select': '#1a1a3d'},
+    'Neon Purple': {'bg': '#1a0a1a', 'fg': '#cc00ff', 'accent': '#ffff00', 'select': '#3d1a3d'},
+    'Hacker Orange': {'bg': '#1a1a0a', 'fg': '#ff9900', 'accent': '#00ff00', 'select': '#3d3d1a'},
+    'Terminal White': {'bg': '#000000', 'fg': '#ffffff', 'accent': '#ffff00', 'select': '#333333'},
+    'Blood Red': {'bg': '#1a0000', 'fg': '#ff3333', 'accent': '#ffff00', 'select': '#3d1a1a'},
+    'Stealth Gray': {'bg': '#1a1a1a', 'fg': '#cccccc', 'accent': '#00aaff', 'select': '#333333'},
+    'Retro Amber': {'bg': '#0a0a00', 'fg': '#ffbb00', 'accent': '#00ff00', 'select': '#3d3d1a'},
+    'Electric Pink': {'bg': '#1a0a1a', 'fg': '#ff00aa', 'accent': '#00ffff', 'select': '#3d1a3d'},
+    'Deep Ocean': {'bg': '#001122', 'fg': '#4499ff', 'accent': '#00ffaa', 'select': '#1a2244'},
+}
+
+# Read-only view handed to callers, so none of them can edit the shared table
+_COLOR_SCHEMES_VIEW = MappingProxyType({
+    name: MappingProxyType(colors) for name, colors in COLOR_SCHEMES.items()
+})
 
 
 class SettingsManager:
@@ -115,26 +136,14 @@ class SettingsManager:
             if value:
                 self.config[key] = value
     
-    def get_color_schemes(self) -> Dict[str, Dict[str, str]]:
-        """Get available color schemes"""
-        return {
-            'Matrix Green': {'bg': '#0a0a0a', 'fg': '#00ff41', 'accent': '#ff6600', 'select': '#1a3d1a'},
-            'Cyber Blue': {'bg': '#0a0a1a', 'fg': '#00ccff', 'accent': '#ff6600', 'select': '#1a1a3d'},
-            'Neon Purple': {'bg': '#1a0a1a', 'fg': '#cc00ff', 'accent': '#ffff00', 'select': '#3d1a3d'},
-            'Hacker Orange': {'bg': '#1a1a0a', 'fg': '#ff9900', 'accent': '#00ff00', 'select': '#3d3d1a'},
-            'Terminal White': {'bg': '#000000', 'fg': '#ffffff', 'accent': '#ffff00', 'select': '#333333'},
-            'Blood Red': {'bg': '#1a0000', 'fg': '#ff3333', 'accent': '#ffff00', 'select': '#3d1a1a'},
-            'Stealth Gray': {'bg': '#1a1a1a', 'fg': '#cccccc', 'accent': '#00aaff', 'select': '#333333'},
-            'Retro Amber': {'bg': '#0a0a00', 'fg': '#ffbb00', 'accent': '#00ff00', 'select': '#3d3d1a'},
-            'Electric Pink': {'bg': '#1a0a1a', 'fg': '#ff00aa', 'accent': '#00ffff', 'select': '#3d1a3d'},
-            'Deep Ocean': {'bg': '#001122', 'fg': '#4499ff', 'accent': '#00ffaa', 'select': '#1a2244'},
-        }
+    def get_color_schemes(self) -> Mapping[str, Mapping[str, str]]:
+        """Get available color schemes (read-only)"""
+        return _COLOR_SCHEMES_VIEW
     
     def apply_color_scheme(self, scheme_name: str):
         """Apply a color scheme"""
-        schemes = self.get_color_schemes()
-        if scheme_name in schemes:
-            colors = schemes[scheme_name]
+        if scheme_name in COLOR_SCHEMES:
+            colors = COLOR_SCHEMES[scheme_name]
             self.config.update({
                 'color_scheme': scheme_name,
                 'bg_color': colors['bg'],
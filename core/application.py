@@ -129,12 +129,16 @@ class HUDNotesApp:
         if self.overlay:
             self.overlay.show()
             self.overlay_visible = True
+            if self.auto_features:
+                self.auto_features.on_overlay_shown()
     
     def hide_overlay(self):
         """Hide the overlay"""
         if self.overlay:
             self.overlay.hide()
             self.overlay_visible = False
+            if self.auto_features:
+                self.auto_features.on_overlay_hidden()
     
     def new_note(self):
         """Create a new note with template selection"""
@@ -237,9 +241,9 @@ class HUDNotesApp:
             print("Setup not completed. Cannot start application.")
             return
 
-        print("HUD Notes Started")
-        print(f"  Notes Directory: {self.notes_dir}")
-        print(f"  Press Ctrl+Alt+H to toggle HUD overlay")
+        print("HUD Notes Started\n"
+              f"  Notes Directory: {self.notes_dir}\n"
+              "  Press Ctrl+Alt+H to toggle HUD overlay")
 
         try:
             if self.overlay:
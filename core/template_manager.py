@@ -16,8 +16,6 @@ class TemplateManager:
     
     def load_templates(self):
         """Load hardcoded templates"""
-        print("DEBUG: Loading hardcoded templates...")
-        
         self.templates = {
             "Basic": "# {title}\n\n**Author:** {author}\n**Date:** {date}\n\n---\n\n",
             
@@ -250,9 +248,6 @@ REM Batch script content here
 
 """
         }
-        
-        print(f"DEBUG: Loaded {len(self.templates)} hardcoded templates")
-        print(f"DEBUG: Template names: {list(self.templates.keys())}")
     
     def get_template_names(self) -> List[str]:
         """Get list of available template names"""
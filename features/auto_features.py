@@ -2,7 +2,6 @@
 Auto show/hide features for HUD Notes - THREAD SAFE VERSION
 """
 
-import threading
 import time
 from pynput import mouse
 import queue
@@ -18,12 +17,14 @@ class AutoFeatureManager:
         # Thread-safe communication queue
         self.command_queue = queue.Queue()
 
-        # Mouse hover monitoring
-        self.hover_monitor_active = False
-        self.hover_monitor_thread = None
+        # Mouse hover monitoring (Tk after() loop on the overlay root)
+        self._hover_after_id = None
+        self._hover_cooldown_until = 0.0
 
-        # Click outside monitoring
+        # Click outside monitoring - the global listener only runs while
+        # the overlay is visible, since hidden-state clicks are ignored
         self.click_listener = None
+        self._click_outside_enabled = False
 
         # Track whether a click landed inside the overlay window.
         # Set to True by a Tkinter <Button-1> binding on the overlay root,
@@ -70,14 +71,14 @@ class AutoFeatureManager:
                 pass
 
             # Schedule next check
-            if hasattr(self.app, 'overlay') and self.app.overlay and self.app.overlay.root:
+            if self.app.overlay and self.app.overlay.root:
                 try:
                     self.app.overlay.root.after(100, process_commands)
                 except:
                     pass
 
         # Start the processor
-        if hasattr(self.app, 'overlay') and self.app.overlay and self.app.overlay.root:
+        if self.app.overlay and self.app.overlay.root:
             self.app.overlay.root.after(200, process_commands)
 
     def mark_click_inside(self, event=None):
@@ -86,49 +87,58 @@ class AutoFeatureManager:
         self._click_was_inside = True
 
     def setup_mouse_hover_monitor(self):
-        """Setup mouse hover monitoring for top-left corner - THREAD SAFE VERSION"""
-        if hasattr(self, 'hover_monitor_thread') and self.hover_monitor_thread and self.hover_monitor_thread.is_alive():
-            return
+        """Setup mouse hover monitoring for top-left corner.
 
-        self.hover_monitor_active = True
+        Polls the pointer from the Tk event loop instead of a background
+        thread, so showing the overlay needs no cross-thread hand-off.
+        """
+        if self._hover_after_id is not None:
+            return
 
-        def hover_monitor():
-            """Monitor mouse position for top-left corner hover"""
-            while self.hover_monitor_active:
-                try:
-                    if not self.app.overlay_visible:
-                        try:
-                            from pynput.mouse import Controller
-                            mouse_controller = Controller()
-                            mouse_x, mouse_y = mouse_controller.position
+        if self.app.overlay and self.app.overlay.root:
+            self._hover_after_id = self.app.overlay.root.after(100, self._hover_tick)
 
-                            # Check if mouse is in top-left corner (50x50 pixels)
-                            if mouse_x <= 50 and mouse_y <= 50 and mouse_x > 0 and mouse_y > 0:
-                                self.command_queue.put(('show_overlay',))
-                                time.sleep(1)  # Prevent rapid toggling
-                        except Exception:
-                            pass
+    def _hover_tick(self):
+        """Check whether the pointer is in the top-left corner - runs in main thread"""
+        root = self.app.overlay.root if self.app.overlay else None
+        if not root:
+            self._hover_after_id = None
+            return
 
-                    time.sleep(0.1)  # Check every 100ms
+        try:
+            if not self.app.overlay_visible and time.monotonic() >= self._hover_cooldown_until:
+                mouse_x, mouse_y = root.winfo_pointerxy()
 
-                except Exception:
-                    time.sleep(0.5)  # Wait longer on error
-                    continue
+                # Check if mouse is in top-left corner (50x50 pixels)
+                if 0 < mouse_x <= 50 and 0 < mouse_y <= 50:
+                    self.app.show_overlay()
+                    self._hover_cooldown_until = time.monotonic() + 1  # Prevent rapid toggling
+        except Exception:
+            pass
 
-        self.hover_monitor_thread = threading.Thread(target=hover_monitor, daemon=True)
-        self.hover_monitor_thread.start()
+        # Schedule next check
+        try:
+            self._hover_after_id = root.after(100, self._hover_tick)
+        except Exception:
+            self._hover_after_id = None
 
     def stop_mouse_hover_monitor(self):
         """Stop mouse hover monitoring"""
-        self.hover_monitor_active = False
-        if self.hover_monitor_thread:
+        if self._hover_after_id is not None:
             try:
-                self.hover_monitor_thread.join(timeout=1)
+                self.app.overlay.root.after_cancel(self._hover_after_id)
             except:
                 pass
+            self._hover_after_id = None
 
     def setup_click_outside_monitor(self):
         """Setup click outside monitoring"""
+        self._click_outside_enabled = True
+        if self.app.overlay_visible:
+            self._start_click_listener()
+
+    def _start_click_listener(self):
+        """Start the global click listener"""
         def on_global_click(x, y, button, pressed):
             """Handle global mouse clicks"""
             if pressed and self.app.overlay_visible:
@@ -137,20 +147,36 @@ class AutoFeatureManager:
                 except Exception:
                     pass
 
-        if not hasattr(self, 'click_listener') or not self.click_listener or not self.click_listener.running:
+        if not self.click_listener or not self.click_listener.running:
             try:
                 self.click_listener = mouse.Listener(on_click=on_global_click)
                 self.click_listener.start()
             except Exception as e:
                 print(f"Click outside monitor setup error: {e}")
 
-    def stop_click_outside_monitor(self):
-        """Stop click outside monitoring"""
+    def _stop_click_listener(self):
+        """Stop the global click listener"""
         if self.click_listener and self.click_listener.running:
             try:
                 self.click_listener.stop()
             except:
                 pass
+        self.click_listener = None
+
+    def stop_click_outside_monitor(self):
+        """Stop click outside monitoring"""
+        self._click_outside_enabled = False
+        self._stop_click_listener()
+
+    def on_overlay_shown(self):
+        """Start listening for outside clicks once the overlay is visible"""
+        if self._click_outside_enabled:
+            self._start_click_listener()
+
+    def on_overlay_hidden(self):
+        """Stop listening for outside clicks while the overlay is hidden"""
+        self._click_was_inside = False
+        self._stop_click_listener()
 
     def update_settings(self):
         """Update auto features based on current settings"""
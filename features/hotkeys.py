@@ -2,20 +2,34 @@
 Minimal hotkey management - ONLY toggle show/hide - THREAD SAFE VERSION
 """
 
-import threading
 from pynput import keyboard
+from functools import partial
 from typing import Dict, Callable
 import queue
 
 
+# Window positioning shortcuts, routed through virtual events so the root
+# window and every text area share a single binding per action
+POSITION_EVENTS = {
+    '<<MoveTopLeft>>': '<Control-Alt-Key-1>',
+    '<<MoveTopRight>>': '<Control-Alt-Key-2>',
+    '<<MoveBottomLeft>>': '<Control-Alt-Key-3>',
+    '<<MoveBottomRight>>': '<Control-Alt-Key-4>',
+    '<<CenterWindow>>': '<Control-Alt-Key-5>',
+}
+
+# Bind tag prepended to text areas so position shortcuts stop before the Text class
+TEXT_SHORTCUTS_TAG = 'HUDTextShortcuts'
+
+
 class HotkeyManager:
     """Manages only the essential toggle hotkey with thread-safe communication"""
 
     def __init__(self, app):
         self.app = app
         self.listener = None
-        self.hotkey_thread = None
         self.running = False
+        self._text_shortcuts_bound = False
 
         # Thread-safe communication queue
         self.command_queue = queue.Queue()
@@ -28,32 +42,31 @@ class HotkeyManager:
         self._start_queue_processor()
 
     def _setup_global_hotkeys(self):
-        """Setup global hotkeys with thread-safe queue communication"""
-        def hotkey_listener():
-            try:
-                hotkey_map = {}
+        """Setup global hotkeys with thread-safe queue communication
 
-                pynput_toggle = self._convert_hotkey_string(self.toggle_hotkey)
-                if pynput_toggle:
-                    hotkey_map[pynput_toggle] = lambda: self.command_queue.put(('toggle_overlay',))
+        GlobalHotKeys runs its own listener thread, so it is started
+        directly and stopped in shutdown() instead of being polled.
+        """
+        try:
+            hotkey_map = {}
 
-                pynput_quit = self._convert_hotkey_string(self.quit_hotkey)
-                if pynput_quit:
-                    hotkey_map[pynput_quit] = lambda: self.command_queue.put(('quit',))
+            pynput_toggle = self._convert_hotkey_string(self.toggle_hotkey)
+            if pynput_toggle:
+                hotkey_map[pynput_toggle] = partial(self.command_queue.put, ('toggle_overlay',))
 
-                if hotkey_map:
-                    with keyboard.GlobalHotKeys(hotkey_map):
-                        self.running = True
-                        while self.running:
-                            import time
-                            time.sleep(0.1)
+            pynput_quit = self._convert_hotkey_string(self.quit_hotkey)
+            if pynput_quit:
+                hotkey_map[pynput_quit] = partial(self.command_queue.put, ('quit',))
 
-            except Exception as e:
-                print(f"Global hotkey listener error: {e}")
-                self.running = False
+            if hotkey_map:
+                self.listener = keyboard.GlobalHotKeys(hotkey_map)
+                self.listener.daemon = True
+                self.listener.start()
+                self.running = True
 
-        self.hotkey_thread = threading.Thread(target=hotkey_listener, daemon=True)
-        self.hotkey_thread.start()
+        except Exception as e:
+            print(f"Global hotkey listener error: {e}")
+            self.running = False
 
     def _start_queue_processor(self):
         """Start the queue processor in the main thread"""
@@ -77,14 +90,14 @@ class HotkeyManager:
                 pass
 
             # Schedule next check
-            if hasattr(self.app, 'overlay') and self.app.overlay and self.app.overlay.root:
+            if self.app.overlay and self.app.overlay.root:
                 try:
                     self.app.overlay.root.after(50, process_commands)
                 except:
                     pass
 
         # Start the processor
-        if hasattr(self.app, 'overlay') and self.app.overlay and self.app.overlay.root:
+        if self.app.overlay and self.app.overlay.root:
             self.app.overlay.root.after(100, process_commands)
 
     def _convert_hotkey_string(self, hotkey_string: str) -> str:
@@ -132,50 +145,74 @@ class HotkeyManager:
 
     def setup_window_shortcuts(self, window):
         """Setup window-specific keyboard shortcuts - FULL FEATURE SET"""
+        app = self.app
         shortcuts = {
-            '<Control-Alt-n>': lambda e: self.app.new_note(),
-            '<Control-Alt-o>': lambda e: self.app.open_note(),
-            '<Control-Alt-s>': lambda e: self.app.save_note(),
-            '<Control-Alt-S>': lambda e: self.app.save_as_note(),
-            '<Control-Alt-p>': lambda e: self.app.toggle_preview(),
-            '<Control-Alt-plus>': lambda e: self.app.increase_font(),
-            '<Control-Alt-minus>': lambda e: self.app.decrease_font(),
-            '<Control-Alt-c>': lambda e: self.app.open_code_window(),
-            '<Control-Alt-g>': lambda e: self.app.open_settings(),
-            '<Control-Alt-r>': lambda e: self.app.reset_position(),
-            '<Control-Alt-m>': lambda e: self.app.move_to_next_display(),
-            '<Control-Alt-q>': lambda e: self.app.shutdown(),
-            '<Escape>': lambda e: self.app.hide_overlay(),
-
-            # Window positioning
-            '<Control-Alt-1>': lambda e: self.app.move_to_corner('top-left'),
-            '<Control-Alt-2>': lambda e: self.app.move_to_corner('top-right'),
-            '<Control-Alt-3>': lambda e: self.app.move_to_corner('bottom-left'),
-            '<Control-Alt-4>': lambda e: self.app.move_to_corner('bottom-right'),
-            '<Control-Alt-5>': lambda e: self.app.center_window(),
+            '<Control-Alt-n>': partial(self._action_handler, app.new_note),
+            '<Control-Alt-o>': partial(self._action_handler, app.open_note),
+            '<Control-Alt-s>': partial(self._action_handler, app.save_note),
+            '<Control-Alt-S>': partial(self._action_handler, app.save_as_note),
+            '<Control-Alt-p>': partial(self._action_handler, app.toggle_preview),
+            '<Control-Alt-plus>': partial(self._action_handler, app.increase_font),
+            '<Control-Alt-minus>': partial(self._action_handler, app.decrease_font),
+            '<Control-Alt-c>': partial(self._action_handler, app.open_code_window),
+            '<Control-Alt-g>': partial(self._action_handler, app.open_settings),
+            '<Control-Alt-r>': partial(self._action_handler, app.reset_position),
+            '<Control-Alt-m>': partial(self._action_handler, app.move_to_next_display),
+            '<Control-Alt-q>': partial(self._action_handler, app.shutdown),
+            '<Escape>': partial(self._action_handler, app.hide_overlay),
         }
 
+        # Window positioning - map the key sequences to virtual events once
+        for virtual, sequence in POSITION_EVENTS.items():
+            window.event_add(virtual, sequence)
+        shortcuts.update(self._get_position_shortcuts())
+
         for shortcut, action in shortcuts.items():
             try:
                 window.bind(shortcut, action)
             except Exception as e:
                 print(f"Error binding shortcut {shortcut}: {e}")
 
-    def setup_text_area_shortcuts(self, text_area):
-        """Setup text area specific shortcuts"""
-        position_shortcuts = {
-            '<Control-Alt-1>': lambda e: (self.app.move_to_corner('top-left'), "break")[1],
-            '<Control-Alt-2>': lambda e: (self.app.move_to_corner('top-right'), "break")[1],
-            '<Control-Alt-3>': lambda e: (self.app.move_to_corner('bottom-left'), "break")[1],
-            '<Control-Alt-4>': lambda e: (self.app.move_to_corner('bottom-right'), "break")[1],
-            '<Control-Alt-5>': lambda e: (self.app.center_window(), "break")[1],
+    def _get_position_shortcuts(self) -> Dict[str, Callable]:
+        """Get window positioning handlers keyed by virtual event"""
+        return {
+            '<<MoveTopLeft>>': partial(self._corner_handler, 'top-left'),
+            '<<MoveTopRight>>': partial(self._corner_handler, 'top-right'),
+            '<<MoveBottomLeft>>': partial(self._corner_handler, 'bottom-left'),
+            '<<MoveBottomRight>>': partial(self._corner_handler, 'bottom-right'),
+            '<<CenterWindow>>': self._center_handler,
         }
 
-        for shortcut, action in position_shortcuts.items():
-            try:
-                text_area.bind(shortcut, action)
-            except Exception as e:
-                print(f"Error binding text area shortcut {shortcut}: {e}")
+    def _action_handler(self, action, event=None):
+        """Run an application action and stop further key processing"""
+        action()
+        return "break"
+
+    def _corner_handler(self, corner, event=None):
+        """Move the window to a corner and stop further key processing"""
+        self.app.move_to_corner(corner)
+        return "break"
+
+    def _center_handler(self, event=None):
+        """Center the window and stop further key processing"""
+        self.app.center_window()
+        return "break"
+
+    def setup_text_area_shortcuts(self, text_area):
+        """Setup text area specific shortcuts
+
+        Position shortcuts are bound once on a shared bind tag placed ahead
+        of the Text class bindings; each text area only gets the tag.
+        """
+        if not self._text_shortcuts_bound:
+            for shortcut, action in self._get_position_shortcuts().items():
+                try:
+                    text_area.bind_class(TEXT_SHORTCUTS_TAG, shortcut, action)
+                except Exception as e:
+                    print(f"Error binding text area shortcut {shortcut}: {e}")
+            self._text_shortcuts_bound = True
+
+        text_area.bindtags((TEXT_SHORTCUTS_TAG,) + text_area.bindtags())
 
     def update_hotkeys(self, new_hotkeys: Dict[str, str]):
         """Update hotkey configuration"""
@@ -188,8 +225,9 @@ class HotkeyManager:
         """Shutdown hotkey manager"""
         self.running = False
 
-        if self.hotkey_thread and self.hotkey_thread.is_alive():
+        if self.listener:
             try:
-                self.hotkey_thread.join(timeout=1)
+                self.listener.stop()
             except:
                 pass
+            self.listener = None
@@ -4,6 +4,11 @@ Syntax highlighting system for HUD Notes
 
 import re
 import tkinter as tk
+from bisect import bisect_right
+from itertools import accumulate
+
+
+CODE_BLOCK_PATTERN = re.compile(r'```(\w+)?\n(.*?)\n```', re.DOTALL)
 
 
 class SyntaxHighlighter:
@@ -14,12 +19,17 @@ class SyntaxHighlighter:
         self.settings = settings
         self.theme_manager = theme_manager
         
+        # Offsets of the first character of each line in the last highlighted content
+        self._line_starts = [0]
+        
         # Only setup tags if we have a text widget
         if self.text_widget:
             self.setup_tags()
     
     def set_text_widget(self, text_widget):
         """Set or change the text widget for highlighting"""
+        if text_widget is self.text_widget:
+            return  # Tags are already configured on this widget
         self.text_widget = text_widget
         if self.text_widget:
             self.setup_tags()
@@ -114,12 +124,24 @@ class SyntaxHighlighter:
         self.setup_tags()
 
         # Reapply highlighting
+        self._build_line_index(content)
         self._highlight_markdown(content)
         self._highlight_code_blocks(content)
         self._highlight_file_paths(content)
         self._highlight_urls(content)
         self._highlight_special_keywords(content)
     
+    def _build_line_index(self, content):
+        """Index line start offsets so match offsets map straight to line.col"""
+        self._line_starts = list(accumulate(
+            (len(line) + 1 for line in content.split('\n')), initial=0
+        ))
+    
+    def _pos(self, offset):
+        """Convert a character offset into a Tk text index"""
+        line = bisect_right(self._line_starts, offset) - 1
+        return f"{line + 1}.{offset - self._line_starts[line]}"
+    
     def _highlight_markdown(self, content):
         """Highlight markdown elements"""
         if not self.text_widget:
@@ -128,29 +150,29 @@ class SyntaxHighlighter:
         # Headers
         header_pattern = r'^#+\s.*'
         for match in re.finditer(header_pattern, content, re.MULTILINE):
-            start_pos = f"1.0+{match.start()}c"
-            end_pos = f"1.0+{match.end()}c"
+            start_pos = self._pos(match.start())
+            end_pos = self._pos(match.end())
             self.text_widget.tag_add("heading", start_pos, end_pos)
         
         # Bold text
         bold_pattern = r'\*\*[^*]+\*\*'
         for match in re.finditer(bold_pattern, content):
-            start_pos = f"1.0+{match.start()}c"
-            end_pos = f"1.0+{match.end()}c"
+            start_pos = self._pos(match.start())
+            end_pos = self._pos(match.end())
             self.text_widget.tag_add("bold", start_pos, end_pos)
         
         # Italic text
         italic_pattern = r'\*[^*]+\*'
         for match in re.finditer(italic_pattern, content):
-            start_pos = f"1.0+{match.start()}c"
-            end_pos = f"1.0+{match.end()}c"
+            start_pos = self._pos(match.start())
+            end_pos = self._pos(match.end())
             self.text_widget.tag_add("italic", start_pos, end_pos)
         
         # List items
         list_pattern = r'^[\s]*[-*+]\s.*'
         for match in re.finditer(list_pattern, content, re.MULTILINE):
-            start_pos = f"1.0+{match.start()}c"
-            end_pos = f"1.0+{match.end()}c"
+            start_pos = self._pos(match.start())
+            end_pos = self._pos(match.end())
             self.text_widget.tag_add("list_item", start_pos, end_pos)
     
     def _highlight_code_blocks(self, content):
@@ -158,10 +180,14 @@ class SyntaxHighlighter:
         if not self.text_widget:
             return
             
-        code_pattern = r'```(\w+)?\n(.*?)\n```'
-        for match in re.finditer(code_pattern, content, re.DOTALL):
-            start_pos = f"1.0+{match.start()}c"
-            end_pos = f"1.0+{match.end()}c"
+        # Cheap substring scan first - most notes have no fenced blocks
+        first_fence = content.find('```')
+        if first_fence < 0 or content.find('```', first_fence + 3) < 0:
+            return
+        
+        for match in CODE_BLOCK_PATTERN.finditer(content, first_fence):
+            start_pos = self._pos(match.start())
+            end_pos = self._pos(match.end())
             self.text_widget.tag_add("code_block", start_pos, end_pos)
     
     def _highlight_file_paths(self, content):
@@ -179,8 +205,8 @@ class SyntaxHighlighter:
         
         for pattern in file_patterns:
             for match in re.finditer(pattern, content):
-                start_pos = f"1.0+{match.start()}c"
-                end_pos = f"1.0+{match.end()}c"
+                start_pos = self._pos(match.start())
+                end_pos = self._pos(match.end())
                 self.text_widget.tag_add("filepath", start_pos, end_pos)
     
     def _highlight_urls(self, content):
@@ -190,8 +216,8 @@ class SyntaxHighlighter:
             
         url_pattern = r'https?://[^\s\n]+'
         for match in re.finditer(url_pattern, content):
-            start_pos = f"1.0+{match.start()}c"
-            end_pos = f"1.0+{match.end()}c"
+            start_pos = self._pos(match.start())
+            end_pos = self._pos(match.end())
             self.text_widget.tag_add("url", start_pos, end_pos)
     
     def _highlight_special_keywords(self, content):
@@ -207,19 +233,18 @@ class SyntaxHighlighter:
         
         for tag, pattern in special_patterns.items():
             for match in re.finditer(pattern, content, re.IGNORECASE):
-                start_pos = f"1.0+{match.start()}c"
-                end_pos = f"1.0+{match.end()}c"
+                start_pos = self._pos(match.start())
+                end_pos = self._pos(match.end())
                 self.text_widget.tag_add(tag, start_pos, end_pos)
     
     def update_font_size(self, font_size):
         """Update font size for all tags"""
         if self.settings:
             self.settings.set('font_size', font_size)
-        self.setup_tags()
+        # apply_highlighting re-runs setup_tags itself
         self.apply_highlighting()
     
     def update_theme(self, theme_manager):
         """Update theme manager and reapply highlighting"""
         self.theme_manager = theme_manager
-        self.setup_tags()
         self.apply_highlighting()
\ No newline at end of file
@@ -5,6 +5,10 @@ Window positioning and management for HUD Notes
 from typing import Tuple
 
 
+# Bind tag shared by every widget that acts as a window drag handle
+DRAG_HANDLE_TAG = 'HUDDragHandle'
+
+
 class WindowManager:
     """Manages window positioning, resizing, and multi-monitor support"""
     
@@ -17,6 +21,8 @@ class WindowManager:
         self.dragging = False
         self.drag_x = 0
         self.drag_y = 0
+        self._drag_position = None
+        self._drag_class_bound = False
         
         # Resizing state
         self.resizing = False
@@ -28,6 +34,20 @@ class WindowManager:
         self.resize_start_height = 0
         self.resize_start_window_x = 0
         self.resize_start_window_y = 0
+        
+        # Pending resize geometry, applied once per idle cycle
+        self._pending_geometry = None
+        self._geometry_scheduled = False
+        
+        # Last <Configure> seen on the window; geometry is only re-read
+        # and re-parsed when it has changed since the last save
+        self._last_configure = None
+        self._geometry_dirty = True
+        # Geometry string last copied into settings
+        self._saved_geometry = None
+        
+        # Pending config write after keyboard repositioning
+        self._config_save_timer = None
     
     def set_window(self, window):
         """Set the window reference"""
@@ -42,13 +62,34 @@ class WindowManager:
             self.window.bind('<Button-1>', self._on_mouse_click)
             self.window.bind('<B1-Motion>', self._on_mouse_drag)
             self.window.bind('<ButtonRelease-1>', self._on_mouse_release)
+            self.window.bind('<Configure>', self._on_configure, add='+')
+    
+    def _on_configure(self, event):
+        """Track moves/resizes of the window so unchanged geometry isn't re-saved"""
+        if event.widget is not self.window:
+            return
+        
+        configure = (event.x, event.y, event.width, event.height)
+        if configure != self._last_configure:
+            self._last_configure = configure
+            self._geometry_dirty = True
     
     def setup_drag_handlers(self, widget):
-        """Setup drag handlers for a widget"""
-        widget.bind('<Button-1>', self._start_drag)
-        widget.bind('<B1-Motion>', self._on_drag)
-        widget.bind('<ButtonRelease-1>', self._stop_drag)
-        widget.bind('<Double-Button-1>', lambda e: self.reset_to_quarter_screen())
+        """Setup drag handlers for a widget
+        
+        Handlers are bound once on a shared bind tag; each drag handle
+        only gets the tag prepended to its bindtags.
+        """
+        if not self._drag_class_bound:
+            widget.bind_class(DRAG_HANDLE_TAG, '<Button-1>', self._start_drag)
+            widget.bind_class(DRAG_HANDLE_TAG, '<B1-Motion>', self._on_drag)
+            widget.bind_class(DRAG_HANDLE_TAG, '<ButtonRelease-1>', self._stop_drag)
+            widget.bind_class(DRAG_HANDLE_TAG, '<Double-Button-1>',
+                              lambda e: self.reset_to_quarter_screen())
+            self._drag_class_bound = True
+        
+        if DRAG_HANDLE_TAG not in widget.bindtags():
+            widget.bindtags((DRAG_HANDLE_TAG,) + widget.bindtags())
     
     def _start_drag(self, event):
         """Start window dragging"""
@@ -56,6 +97,7 @@ class WindowManager:
             self.drag_x = event.x_root - self.window.winfo_x()
             self.drag_y = event.y_root - self.window.winfo_y()
             self.dragging = True
+            self._drag_position = None
             self.window.config(cursor="fleur")
             event.widget.config(cursor="fleur")
     
@@ -73,6 +115,7 @@ class WindowManager:
             )
             
             self.window.geometry(f"+{x}+{y}")
+            self._drag_position = (x, y)
     
     def _stop_drag(self, event):
         """Stop window dragging"""
@@ -81,8 +124,11 @@ class WindowManager:
             self.window.config(cursor="")
             event.widget.config(cursor="")
             
-            # Save new position
-            self._save_window_geometry()
+            # Save new position - already known from the drag, no need to
+            # read the geometry string back
+            if self._drag_position:
+                x, y = self._drag_position
+                self.settings.update({'window_x': x, 'window_y': y})
     
     def _on_mouse_motion(self, event):
         """Handle mouse motion for resize cursor changes"""
@@ -201,12 +247,23 @@ class WindowManager:
             if new_height > min_height:
                 new_y = self.resize_start_window_y + dy
         
-        # Apply the new geometry
-        self.window.geometry(f"{new_width}x{new_height}+{new_x}+{new_y}")
+        # Coalesce motion events into a single geometry change per idle cycle
+        self._pending_geometry = f"{new_width}x{new_height}+{new_x}+{new_y}"
+        if not self._geometry_scheduled:
+            self._geometry_scheduled = True
+            self.window.after_idle(self._flush_geometry)
+    
+    def _flush_geometry(self):
+        """Apply the most recent pending resize geometry"""
+        self._geometry_scheduled = False
+        if self._pending_geometry and self.window:
+            self.window.geometry(self._pending_geometry)
+        self._pending_geometry = None
     
     def _on_mouse_release(self, event):
         """Handle mouse release to end resizing"""
         if self.resizing and self.window:
+            self._flush_geometry()
             self.resizing = False
             self.resize_direction = None
             self.window.config(cursor="")
@@ -216,11 +273,14 @@ class WindowManager:
     
     def _save_window_geometry(self):
         """Save current window geometry to settings - THREAD SAFE VERSION"""
-        if not self.window:
+        if not self.window or not self._geometry_dirty:
             return
 
         try:
             geometry = self.window.geometry()
+            if geometry == self._saved_geometry:
+                self._geometry_dirty = False
+                return
 
             if '+' in geometry:
                 try:
@@ -233,6 +293,8 @@ class WindowManager:
                         'window_x': int(x),
                         'window_y': int(y)
                     })
+                    self._geometry_dirty = False
+                    self._saved_geometry = geometry
                     # Defer disk write — config is saved on shutdown or explicit save
                 except Exception:
                     pass
@@ -271,6 +333,15 @@ class WindowManager:
         display = self.display_manager.get_current_display()
         return f"Reset to right 1/4 of {display['name']}"
     
+    def _is_at(self, x: int, y: int) -> bool:
+        """Check whether the shown window is actually at x, y
+        
+        Asks Tk rather than the stored window_x/window_y, which lag behind
+        window manager moves and unflushed drags.
+        """
+        return (bool(self.window.winfo_viewable())
+                and self.window.winfo_x() == x and self.window.winfo_y() == y)
+    
     def move_to_corner(self, position: str):
         """Move window to specified corner"""
         if not self.window:
@@ -280,10 +351,12 @@ class WindowManager:
         height = self.settings.get('window_height', 600)
         
         x, y = self.display_manager.get_corner_position(position, width, height)
+        if self._is_at(x, y):
+            return f"Already at {position}"
         
         self.window.geometry(f"+{x}+{y}")
         self.settings.update({'window_x': x, 'window_y': y})
-        self.settings.save_config()
+        self._schedule_config_save()
         
         return f"Moved to {position}"
     
@@ -296,17 +369,18 @@ class WindowManager:
         height = self.settings.get('window_height', 600)
         
         x, y = self.display_manager.get_center_position(width, height)
+        if self._is_at(x, y):
+            return "Window already centered"
         
         self.window.geometry(f"+{x}+{y}")
         self.settings.update({'window_x': x, 'window_y': y})
-        self.settings.save_config()
+        self._schedule_config_save()
         
         return "Window centered"
     
     def move_to_next_display(self):
         """Move to next display"""
-        displays = self.display_manager.get_all_displays()
-        if len(displays) <= 1:
+        if len(self.display_manager.displays) <= 1:
             return "Only one display detected"
         
         # Move to next display
@@ -315,33 +389,45 @@ class WindowManager:
         
         # Get new layout for the display
         layout = self.display_manager.get_quarter_screen_layout()
+        width, height, x, y = layout['width'], layout['height'], layout['x'], layout['y']
         
-        # Update settings and apply
-        self.settings.update({
-            'window_width': layout['width'],
-            'window_height': layout['height'],
-            'window_x': layout['x'],
-            'window_y': layout['y']
-        })
-        
+        # Apply and update settings
         if self.window:
-            self.window.geometry(f"{layout['width']}x{layout['height']}+{layout['x']}+{layout['y']}")
+            self.window.geometry(f"{width}x{height}+{x}+{y}")
         
-        self.settings.save_config()
+        self.settings.update({
+            'window_width': width,
+            'window_height': height,
+            'window_x': x,
+            'window_y': y
+        })
+        self._schedule_config_save()
         
         display = self.display_manager.get_current_display()
         return f"Moved to {display['name']}"
     
+    def _schedule_config_save(self):
+        """Write the config 500 ms after the last of a burst of moves"""
+        if not self.window:
+            self.settings.save_config()
+            return
+        
+        if self._config_save_timer:
+            self.window.after_cancel(self._config_save_timer)
+        self._config_save_timer = self.window.after(500, self._flush_config_save)
+    
+    def _flush_config_save(self):
+        """Save the config scheduled by _schedule_config_save"""
+        self._config_save_timer = None
+        self.settings.save_config()
+    
     def get_window_position_info(self) -> str:
         """Get current window position information"""
         if not self.window:
             return "No window available"
         
-        display = self.display_manager.get_current_display()
-        display_index = self.display_manager.current_display
-        total_displays = len(self.display_manager.get_all_displays())
-        
-        return f"D{display_index + 1}/{total_displays}"
+        display_manager = self.display_manager
+        return f"D{display_manager.current_display + 1}/{len(display_manager.displays)}"
     
     def apply_window_geometry(self):
         """Apply stored window geometry"""
@@ -3,9 +3,23 @@ Reusable UI components for HUD Notes
 """
 
 import tkinter as tk
-from tkinter import Menu
+from tkinter import Menu, font as tkfont
+from functools import partial
 from utils.display_utils import PlatformManager
 
+
+# Named fonts shared by every widget in this module, keyed by (family, size, weight)
+_FONT_CACHE = {}
+
+
+def _font(family, size, weight='normal'):
+    """Return a shared Font object for the given family, size and weight"""
+    key = (family, size, weight)
+    cached = _FONT_CACHE.get(key)
+    if cached is None:
+        cached = _FONT_CACHE[key] = tkfont.Font(family=family, size=size, weight=weight)
+    return cached
+
 class StatusBar:
     """Status bar component"""
     
@@ -14,6 +28,13 @@ class StatusBar:
         self.display_manager = display_manager
         self.theme_manager = theme_manager
         self.app = app
+        self._status_after = None
+        self._ready_scale = None
+        self._ready_status = ""
+        self._last_theme_sig = None
+        self.transparency_label = None
+        self._pending_transparency = None
+        self._transparency_after = None
         
         # Create status frame
         status_height = display_manager.get_scaled_dimension(20)
@@ -21,15 +42,16 @@ class StatusBar:
         self.frame.pack(fill=tk.X)
         self.frame.pack_propagate(False)
         
-        font_size = display_manager.get_scaled_dimension(8)
+        font_size = self._font_size = 8
         
-        # Status label
+        # Status label, driven through a StringVar
+        self._status_var = tk.StringVar(self.frame, value=self._get_ready_status())
         self.status_label = tk.Label(
             self.frame,
-            text=f"Ready | Display Scale: {int(display_manager.dpi_scale * 100)}%",
+            textvariable=self._status_var,
             bg='#1a1a1a',
             fg=settings.get('fg_color', '#00ff41'),
-            font=('Consolas', font_size)
+            font=_font('Consolas', font_size)
         )
         self.status_label.pack(side=tk.LEFT, padx=5, pady=1)
 
@@ -41,18 +63,19 @@ class StatusBar:
     
     def _create_transparency_controls(self, app=None):
         """Create transparency control widgets"""
+        # Packed once its children exist so the status bar is laid out once
         trans_frame = tk.Frame(self.frame, bg='#1a1a1a')
-        trans_frame.pack(side=tk.RIGHT, padx=5)
         
-        font_size = self.display_manager.get_scaled_dimension(8)
+        font_size = self._font_size
         button_size = self.display_manager.get_scaled_dimension(15)  # Width in pixels
         
         # Current transparency display
         current_alpha = int(self.settings.get('hud_transparency', 0.85) * 100)
-        self.transparency_label = tk.Label(trans_frame, text=f"α:{current_alpha}%", 
+        self._transparency_var = tk.StringVar(trans_frame, value=f"α:{current_alpha}%")
+        self.transparency_label = tk.Label(trans_frame, textvariable=self._transparency_var, 
                                         bg='#1a1a1a', 
                                         fg=self.settings.get('fg_color', '#00ff41'),
-                                        font=('Consolas', font_size))
+                                        font=_font('Consolas', font_size))
         self.transparency_label.pack(side=tk.LEFT, padx=2)
 
         # Add tooltip to transparency label
@@ -63,7 +86,7 @@ class StatusBar:
             alpha_minus_btn = tk.Button(trans_frame, text="α-", 
                                     command=app.increase_transparency,
                                     bg='#1a1a1a', fg='#88ccff',
-                                    font=('Consolas', font_size, 'bold'),
+                                    font=_font('Consolas', font_size, 'bold'),
                                     width=button_size, height=1,
                                     relief=tk.FLAT, cursor="hand2")
             alpha_minus_btn.pack(side=tk.LEFT, padx=1)
@@ -73,25 +96,51 @@ class StatusBar:
             alpha_plus_btn = tk.Button(trans_frame, text="α+", 
                                     command=app.decrease_transparency,
                                     bg='#1a1a1a', fg='#88ccff',
-                                    font=('Consolas', font_size, 'bold'),
+                                    font=_font('Consolas', font_size, 'bold'),
                                     width=button_size, height=1,
                                     relief=tk.FLAT, cursor="hand2")
             alpha_plus_btn.pack(side=tk.LEFT, padx=1)
             create_tooltip(alpha_plus_btn, "Increase Transparency\n(More Opaque)\nHotkey: Alt++", self.settings)
+        
+        trans_frame.pack(side=tk.RIGHT, padx=5)
 
     def update_transparency_display(self, transparency_value):
-        """Update transparency percentage display"""
-        if hasattr(self, 'transparency_label'):
-            percentage = int(transparency_value * 100)
-            self.transparency_label.config(text=f"α:{percentage}%")
+        """Update transparency percentage display
+        
+        Rapid changes (held hotkeys) are coalesced into one label update
+        per idle cycle.
+        """
+        if self.transparency_label is not None:
+            self._pending_transparency = transparency_value
+            if self._transparency_after is None:
+                self._transparency_after = self.frame.after_idle(self._flush_transparency_display)
+    
+    def _flush_transparency_display(self):
+        """Show the latest transparency value"""
+        self._transparency_after = None
+        percentage = int(self._pending_transparency * 100)
+        self._transparency_var.set(f"α:{percentage}%")
     
     def update_status(self, message: str):
         """Update status message"""
-        self.status_label.config(text=message)
-        # Auto-clear status after 3 seconds
-        self.frame.after(3000, lambda: self.status_label.config(
-            text=f"Ready | Display Scale: {int(self.display_manager.dpi_scale * 100)}%"
-        ))
+        self._status_var.set(message)
+        # Auto-clear status after 3 seconds - only the latest message's timer is kept
+        if self._status_after:
+            self.frame.after_cancel(self._status_after)
+        self._status_after = self.frame.after(3000, self._restore_status)
+    
+    def _restore_status(self):
+        """Restore the idle status message"""
+        self._status_after = None
+        self._status_var.set(self._get_ready_status())
+    
+    def _get_ready_status(self) -> str:
+        """Get the idle status text, rebuilt only when the DPI scale changes"""
+        dpi_scale = self.display_manager.dpi_scale
+        if dpi_scale != self._ready_scale:
+            self._ready_scale = dpi_scale
+            self._ready_status = f"Ready | Display Scale: {int(dpi_scale * 100)}%"
+        return self._ready_status
     
     def apply_theme(self, theme_manager=None):
         """Apply current theme to status bar"""
@@ -103,31 +152,47 @@ class StatusBar:
             if current_theme:
                 bg_color = current_theme.get_color('status_bg', '#1a1a1a')
                 fg_color = current_theme.get_color('fg_color', '#00ff41')
-                
-                self.frame.configure(bg=bg_color)
-                self.status_label.configure(bg=bg_color, fg=fg_color)
+                self._apply_colors(bg_color, fg_color)
         else:
             # Fallback to settings
-            self.frame.configure(bg='#1a1a1a')
-            self.status_label.configure(
-                bg='#1a1a1a',
-                fg=self.settings.get('fg_color', '#00ff41')
-            )
+            self._apply_colors('#1a1a1a', self.settings.get('fg_color', '#00ff41'))
+    
+    def _apply_colors(self, bg_color, fg_color):
+        """Configure the status bar colors unless they are already applied"""
+        sig = (bg_color, fg_color)
+        if sig == self._last_theme_sig:
+            return
+        self._last_theme_sig = sig
+        self.frame.configure(bg=bg_color)
+        self.status_label.configure(bg=bg_color, fg=fg_color)
     
     def _reset_window_cursor(self):
         """Reset window cursor when interacting with UI elements"""
-        if hasattr(self.app, 'window_manager') and self.app.window_manager:
+        if self.app and self.app.window_manager:
             self.app.window_manager.reset_cursor()
 
 
 class HUDInterface:
     """Main HUD interface with title bar and controls"""
     
+    # Title bar buttons: (text, app method name, color, tooltip, hotkey)
+    _BUTTON_SPEC = (
+        ("T-", "decrease_font", '#ffcc00', "Decrease Font Size", "Ctrl+Alt+-"),
+        ("T+", "increase_font", '#ffcc00', "Increase Font Size", "Ctrl+Alt++"),
+        ("O-", "increase_transparency", '#88ccff', "Decrease Transparency", "Alt+-"),
+        ("O+", "decrease_transparency", '#88ccff', "Increase Transparency", "Alt++"),
+        ("New", "new_note", '#ffff00', "New Note (with Template)", "Ctrl+Alt+N"),
+        ("Open", "open_note", '#00ffff', "Open Note in New Tab", "Ctrl+Alt+O"),
+        ("⚙", "open_settings", '#cccccc', "Settings", None),
+    )
+    
     def __init__(self, parent, app, theme_manager=None):
         self.parent = parent
         self.app = app
         self.theme_manager = theme_manager
         self.file_label = None
+        self._file_var = None
+        self._last_accent = None
         
         self._create_interface()
     
@@ -153,14 +218,15 @@ class HUDInterface:
         title_left = tk.Frame(self.title_frame, bg='#333333')
         title_left.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        font_size = self.app.display_manager.get_scaled_dimension(10)
+        font_size = 10
         
+        self._file_var = tk.StringVar(title_left, value="HUD NOTES [D1/1]")
         self.file_label = tk.Label(
             title_left, 
-            text="HUD NOTES [D1/1]",
+            textvariable=self._file_var,
             bg='#333333', 
             fg=self.app.settings.get('accent_color', '#ff6600'),
-            font=('Consolas', font_size, 'bold')
+            font=_font('Consolas', font_size, 'bold')
         )
         self.file_label.pack(side=tk.LEFT, padx=5, pady=2)
         
@@ -176,7 +242,7 @@ class HUDInterface:
             text="[DRAG HERE]",
             bg='#333333', 
             fg='#666666',
-            font=('Consolas', self.app.display_manager.get_scaled_dimension(8))
+            font=_font('Consolas', 8)
         )
         
         drag_label.pack(side=tk.RIGHT, padx=10, pady=2)
@@ -187,56 +253,61 @@ class HUDInterface:
         
     
     def _create_control_buttons(self):
-        """Create control buttons"""
+        """Create control buttons
+        
+        The buttons are drawn on a single Canvas - one background rectangle
+        and one text item each - with clicks, hover and tooltips handled by
+        tag bindings on the rectangles instead of one Button widget apiece.
+        """
         controls = tk.Frame(self.title_frame, bg='#333333')
-        controls.pack(side=tk.RIGHT, padx=5)
         
         # Larger button dimensions for better usability
-        button_font_size = self.app.display_manager.get_scaled_dimension(11)
+        button_font_size = 11
         button_width = self.app.display_manager.get_scaled_dimension(4)
         button_height = self.app.display_manager.get_scaled_dimension(1.5)
         
-        # Button configurations - ADDED OPEN BUTTON FOR TAB SYSTEM
-        buttons = [
-            ("T-", self.app.decrease_font, '#ffcc00', "Decrease Font Size", "Ctrl+Alt+-"),
-            ("T+", self.app.increase_font, '#ffcc00', "Increase Font Size", "Ctrl+Alt++"),
-            ("O-", self.app.increase_transparency, '#88ccff', "Decrease Transparency", "Alt+-"),
-            ("O+", self.app.decrease_transparency, '#88ccff', "Increase Transparency", "Alt++"),
-            ("New", self.app.new_note, '#ffff00', "New Note (with Template)", "Ctrl+Alt+N"),
-            ("Open", self.app.open_note, '#00ffff', "Open Note in New Tab", "Ctrl+Alt+O"),
-            ("⚙", self.app.open_settings, '#cccccc', "Settings", None)
-        ]
+        self._button_font = _font('Arial', button_font_size, 'bold')
+        slot_width = self._button_font.measure('0') * int(button_width) + 8
+        slot_height = self._button_font.metrics('linespace') * max(1, int(button_height)) + 6
+        gap = 4
         
-        for button_data in buttons:
-            text, command, color, tooltip = button_data[:4]
-            hotkey = button_data[4] if len(button_data) > 4 else None
-            
-            btn = tk.Button(
-                controls,
-                text=text,
-                command=command,
-                bg='#1a1a1a',
-                fg=color,
-                font=('Arial', button_font_size, 'bold'),
-                width=int(button_width),
-                height=int(button_height),
-                relief=tk.FLAT,
-                cursor="hand2"
-            )
-            btn.pack(side=tk.LEFT, padx=2)
+        self.controls_canvas = canvas = tk.Canvas(
+            controls,
+            width=len(self._BUTTON_SPEC) * (slot_width + gap),
+            height=slot_height,
+            bg='#333333',
+            highlightthickness=0,
+            bd=0,
+            cursor="hand2"
+        )
+        canvas.pack()
+        
+        for index, (text, command_name, color, tooltip, hotkey) in enumerate(self._BUTTON_SPEC):
+            x = index * (slot_width + gap) + gap // 2
+            item = canvas.create_rectangle(x, 0, x + slot_width, slot_height,
+                                           fill='#1a1a1a', outline='')
+            # Disabled text ignores the pointer, so hovering the label
+            # still counts as being over the rectangle
+            canvas.create_text(x + slot_width // 2, slot_height // 2, text=text,
+                               fill=color, font=self._button_font, state=tk.DISABLED)
             
             # Enhanced tooltip with hotkey
             full_tooltip = tooltip
             if hotkey:
                 full_tooltip += f"\nHotkey: {hotkey}"
+            show_tooltip = partial(_show_tooltip, full_tooltip, self.app.settings)
             
-            create_tooltip(btn, full_tooltip, self.app.settings)
-            
+            canvas.tag_bind(item, '<ButtonRelease-1>',
+                            partial(self._on_button_click, item, getattr(self.app, command_name)))
+            canvas.tag_bind(item, '<Enter>', partial(self._on_button_enter, item, show_tooltip))
+            canvas.tag_bind(item, '<Leave>', partial(self._on_button_leave, item))
+        
+        controls.pack(side=tk.RIGHT, padx=5)
             
     def update_file_label(self, text: str):
         """Update file label text"""
-        if self.file_label:
-            self.file_label.config(text=text)
+        if self._file_var:
+            self._file_var.set(text)
     
     def apply_theme(self, theme_manager=None):
         """Apply current theme to HUD interface"""
@@ -247,29 +318,58 @@ class HUDInterface:
             current_theme = self.theme_manager.get_current_theme()
             if current_theme:
                 accent_color = current_theme.get_color('accent_color', '#ff6600')
-                self.file_label.configure(fg=accent_color)
+                if accent_color != self._last_accent:
+                    self._last_accent = accent_color
+                    self.file_label.configure(fg=accent_color)
 
     def _reset_window_cursor(self):
         """Reset window cursor when interacting with UI elements"""
-        if hasattr(self.app, 'window_manager') and self.app.window_manager:
+        if self.app and self.app.window_manager:
             self.app.window_manager.reset_cursor()
             
-    def _on_button_enter(self, event, button):
-        """Handle button enter event"""
+    def _on_button_click(self, item, command, event):
+        """Run a title bar button's command if released over the button"""
+        x1, y1, x2, y2 = self.controls_canvas.bbox(item)
+        if x1 <= event.x <= x2 and y1 <= event.y <= y2:
+            command()
+    
+    def _on_button_enter(self, item, show_tooltip, event):
+        """Highlight a title bar button and show its tooltip"""
         self._reset_window_cursor()
+        self.controls_canvas.itemconfig(item, fill='#2a2a2a')
+        show_tooltip(event)
+    
+    def _on_button_leave(self, item, event):
+        """Clear a title bar button's highlight and tooltip"""
+        self.controls_canvas.itemconfig(item, fill='#1a1a1a')
+        _hide_tooltip(event)
 
 class ScreenBorder:
     """Always-visible screen border"""
 
+    # Canvas background keyed out with -transparentcolor on Windows
+    _TRANSPARENT_COLOR = '#ff00ff'
+
     def __init__(self, display_manager, theme_manager=None, parent=None):
         self.display_manager = display_manager
         self.theme_manager = theme_manager
         self.parent = parent
         self.border_windows = []
-        self._create_borders()
+        self.border_canvas = None
+        self.ready = False
+        self._create_after = None
+        
+        # Build the border windows once the main loop is idle so they do not
+        # hold up the main window appearing
+        if parent:
+            self._create_after = parent.after_idle(self._create_borders)
+        else:
+            self._create_borders()
 
     def _create_borders(self):
         """Create screen border windows"""
+        self._create_after = None
+        self.ready = True
         border_dims = self.display_manager.get_border_dimensions()
         border_width = border_dims['width']
         screen_width = border_dims['screen_width']
@@ -282,27 +382,60 @@ class ScreenBorder:
         else:
             border_color = "#00ff41"
 
-        border_configs = [
-            f"{screen_width}x{border_width}+0+0",                              # Top
-            f"{border_width}x{screen_height}+0+0",                              # Left
-            f"{border_width}x{screen_height}+{screen_width-border_width}+0",    # Right
+        # Top, left and right edges as (x1, y1, x2, y2)
+        edges = [
+            (0, 0, screen_width, border_width),
+            (0, 0, border_width, screen_height),
+            (screen_width - border_width, 0, screen_width, screen_height),
         ]
 
-        for geometry in border_configs:
-            border = tk.Toplevel(self.parent) if self.parent else tk.Toplevel()
-            border.geometry(geometry)
+        if PlatformManager.is_windows():
+            self._create_canvas_border(edges, screen_width, screen_height, border_color)
+            return
+
+        # X11/macOS have no -transparentcolor, so a fullscreen window would
+        # tint the screen and swallow clicks - use one strip window per edge
+        for x1, y1, x2, y2 in edges:
+            border = self._create_border_window(f"{x2 - x1}x{y2 - y1}+{x1}+{y1}")
             border.configure(bg=border_color)
-            border.overrideredirect(True)
-            border.attributes('-topmost', True)
-            border.attributes('-alpha', 0.6)
             self.border_windows.append(border)
+
+    def _create_border_window(self, geometry):
+        """Create an undecorated, topmost, translucent border window"""
+        border = tk.Toplevel(self.parent) if self.parent else tk.Toplevel()
+        border.geometry(geometry)
+        border.overrideredirect(True)
+        # One wm attributes call sets both options
+        border.attributes('-topmost', True, '-alpha', 0.6)
+        return border
+
+    def _create_canvas_border(self, edges, screen_width, screen_height, border_color):
+        """Draw all edges on one click-through fullscreen window (Windows)"""
+        border = self._create_border_window(f"{screen_width}x{screen_height}+0+0")
+        border.attributes('-transparentcolor', self._TRANSPARENT_COLOR)
+
+        canvas = tk.Canvas(border, bg=self._TRANSPARENT_COLOR, highlightthickness=0, bd=0)
+        canvas.pack(fill=tk.BOTH, expand=True)
+        for edge in edges:
+            canvas.create_rectangle(*edge, fill=border_color, outline='', tags=('border',))
+
+        self.border_canvas = canvas
+        self.border_windows.append(border)
     
     def update_theme(self, theme_manager):
         """Update border colors when theme changes"""
         self.theme_manager = theme_manager
+        if not self.ready:
+            return  # Deferred creation reads the colors from this theme manager
         current_theme = theme_manager.get_current_theme()
         if current_theme:
             border_color = current_theme.get_color('border_color', '#00ff41')
+            if self.border_canvas is not None:
+                try:
+                    self.border_canvas.itemconfig('border', fill=border_color)
+                except:
+                    pass
+                return
             for border in self.border_windows:
                 try:
                     border.configure(bg=border_color)
@@ -311,6 +444,12 @@ class ScreenBorder:
     
     def cleanup(self):
         """Clean up border windows"""
+        if self._create_after:
+            try:
+                self.parent.after_cancel(self._create_after)
+            except:
+                pass
+            self._create_after = None
         for border in self.border_windows:
             try:
                 border.destroy()
@@ -331,14 +470,15 @@ class ContextMenu:
         self.menu = Menu(self.parent, tearoff=0, 
                         bg='#1a1a1a', fg=self.app.settings.get('fg_color', '#00ff41'))
         
-        self.menu.add_command(label="Undo", command=lambda: self.parent.edit_undo())
-        self.menu.add_command(label="Redo", command=lambda: self.parent.edit_redo())
+        generate = self.parent.event_generate
+        self.menu.add_command(label="Undo", command=self.parent.edit_undo)
+        self.menu.add_command(label="Redo", command=self.parent.edit_redo)
         self.menu.add_separator()
-        self.menu.add_command(label="Cut", command=lambda: self.parent.event_generate("<<Cut>>"))
-        self.menu.add_command(label="Copy", command=lambda: self.parent.event_generate("<<Copy>>"))
-        self.menu.add_command(label="Paste", command=lambda: self.parent.event_generate("<<Paste>>"))
+        self.menu.add_command(label="Cut", command=partial(generate, "<<Cut>>"))
+        self.menu.add_command(label="Copy", command=partial(generate, "<<Copy>>"))
+        self.menu.add_command(label="Paste", command=partial(generate, "<<Paste>>"))
         self.menu.add_separator()
-        self.menu.add_command(label="Select All", command=lambda: self.parent.event_generate("<<SelectAll>>"))
+        self.menu.add_command(label="Select All", command=partial(generate, "<<SelectAll>>"))
         self.menu.add_separator()
         self.menu.add_command(label="Insert Code Block", command=self.app.open_code_window)
         self.menu.add_command(label="New Note (Template)", command=self.app.new_note)
@@ -350,72 +490,130 @@ class ContextMenu:
         finally:
             self.menu.grab_release()
 
+# Bind tag carrying the tooltip <Enter>/<Leave> class bindings
+TOOLTIP_TAG = 'HUDTooltip'
+_tooltip_class_bound = False
+
+# Shared tooltip window, built on first hover and reused by every widget
+_tooltip_win = None
+_tooltip_label = None
+_tooltip_text = None
+_tooltip_sizes = {}  # Tooltip text -> requested (width, height)
+
+
+def _get_tooltip_window():
+    """Return the shared tooltip window, creating it if needed"""
+    global _tooltip_win, _tooltip_label, _tooltip_text
+    try:
+        if _tooltip_win is not None and _tooltip_win.winfo_exists():
+            return _tooltip_win
+    except tk.TclError:
+        pass  # Interpreter it belonged to is gone - build a new one
+    
+    _tooltip_win = tk.Toplevel()
+    _tooltip_win.withdraw()
+    _tooltip_win.wm_overrideredirect(True)
+    _tooltip_win.configure(bg='#2a2a2a', relief=tk.SOLID, bd=1)
+    
+    # Tell the window manager/compositor what this window is so it skips
+    # the handling a normal top-level window gets
+    try:
+        if PlatformManager.is_linux():
+            # Tooltip-typed windows are kept above others; show() also lifts
+            _tooltip_win.attributes('-type', 'tooltip')
+        elif PlatformManager.is_windows():
+            _tooltip_win.attributes('-toolwindow', True, '-topmost', True)
+        else:
+            _tooltip_win.attributes('-topmost', True)
+    except tk.TclError:
+        _tooltip_win.attributes('-topmost', True)
+    
+    _tooltip_label = tk.Label(_tooltip_win, bg='#2a2a2a', fg='#ffffff',
+                              font=_font('Consolas', 9), padx=8, pady=4, justify=tk.LEFT)
+    _tooltip_label.pack()
+    _tooltip_text = None
+    return _tooltip_win
+
+
 def create_tooltip(widget, text, settings=None):
-    """Create tooltip for widget - simplified working version with toggle support"""
+    """Create tooltip for widget
     
-    def show_tooltip(event):
-        # Check if tooltips are enabled
-        if settings and not settings.get('show_tooltips', True):
-            return  # Don't show tooltip if disabled
-        
-        # Remove any existing tooltip
-        if hasattr(widget, 'tooltip_window') and widget.tooltip_window:
-            try:
-                widget.tooltip_window.destroy()
-            except:
-                pass
-            widget.tooltip_window = None
-        
-        # Create new tooltip
-        tooltip = tk.Toplevel()
-        tooltip.wm_overrideredirect(True)
-        tooltip.configure(bg='#2a2a2a', relief=tk.SOLID, bd=1)
-        tooltip.attributes('-topmost', True)
-        
-        # Create label
-        label = tk.Label(tooltip, text=text, bg='#2a2a2a', fg='#ffffff',
-                    font=('Consolas', 9), padx=8, pady=4, justify=tk.LEFT)
-        label.pack()
-        
-        # Position tooltip
-        x = event.x_root + 15
-        y = event.y_root - 25
-        
-        # Keep tooltip on screen
+    Enter/Leave are bound once on the TOOLTIP_TAG class; each widget only
+    gets the tag plus its text and settings stored as attributes.
+    """
+    global _tooltip_class_bound
+    if not _tooltip_class_bound:
+        widget.bind_class(TOOLTIP_TAG, '<Enter>', _on_tooltip_enter)
+        widget.bind_class(TOOLTIP_TAG, '<Leave>', _hide_tooltip)
+        _tooltip_class_bound = True
+    
+    widget._tooltip_text = text
+    widget._tooltip_settings = settings
+    tags = widget.bindtags()
+    if TOOLTIP_TAG not in tags:
+        widget.bindtags(tags + (TOOLTIP_TAG,))
+
+
+def _on_tooltip_enter(event):
+    """Class-level <Enter> handler for widgets carrying TOOLTIP_TAG"""
+    widget = event.widget
+    _show_tooltip(widget._tooltip_text, widget._tooltip_settings, event)
+
+
+def _show_tooltip(text, settings, event):
+    """Show the shared tooltip window with text near the pointer"""
+    global _tooltip_text
+    # Check if tooltips are enabled
+    if settings and not settings.get('show_tooltips', True):
+        return  # Don't show tooltip if disabled
+    
+    tooltip = _get_tooltip_window()
+    
+    if text != _tooltip_text:
+        _tooltip_label.config(text=text)
+        _tooltip_text = text
+    
+    # A Label computes its requested size as soon as it is configured, so
+    # no idle-task flush is needed; the result is cached per text anyway.
+    # The 2 px account for the tooltip window's 1 px border.
+    tooltip_size = _tooltip_sizes.get(text)
+    if tooltip_size is None:
         try:
-            tooltip.update_idletasks()
-            tooltip_width = tooltip.winfo_reqwidth()
-            tooltip_height = tooltip.winfo_reqheight()
-            
-            screen_width = tooltip.winfo_screenwidth()
-            screen_height = tooltip.winfo_screenheight()
-            
-            if x + tooltip_width > screen_width:
-                x = event.x_root - tooltip_width - 5
-            if y + tooltip_height > screen_height:
-                y = event.y_root - tooltip_height - 5
-            if y < 0:
-                y = event.y_root + 25
+            tooltip_size = (_tooltip_label.winfo_reqwidth() + 2,
+                            _tooltip_label.winfo_reqheight() + 2)
         except:
-            pass
-        
-        tooltip.geometry(f"+{x}+{y}")
-        
-        # Store reference
-        widget.tooltip_window = tooltip
-        
+            tooltip_size = (0, 0)
+        _tooltip_sizes[text] = tooltip_size
     
-    def hide_tooltip(event):
-        if hasattr(widget, 'tooltip_window') and widget.tooltip_window:
-            try:
-                widget.tooltip_window.destroy()
-            except:
-                pass
-            widget.tooltip_window = None
+    # Position tooltip
+    x = event.x_root + 15
+    y = event.y_root - 25
     
-    # Initialize tooltip window attribute
-    widget.tooltip_window = None
+    # Keep tooltip on screen
+    try:
+        tooltip_width, tooltip_height = tooltip_size
+        
+        screen_width = tooltip.winfo_screenwidth()
+        screen_height = tooltip.winfo_screenheight()
+        
+        if x + tooltip_width > screen_width:
+            x = event.x_root - tooltip_width - 5
+        if y + tooltip_height > screen_height:
+            y = event.y_root - tooltip_height - 5
+        if y < 0:
+            y = event.y_root + 25
+    except:
+        pass
     
-    # Bind events directly - no delays
-    widget.bind('<Enter>', show_tooltip)
-    widget.bind('<Leave>', hide_tooltip)
+    tooltip.geometry(f"+{x}+{y}")
+    tooltip.deiconify()
+    tooltip.lift()
+
+
+def _hide_tooltip(event=None):
+    """Hide the shared tooltip window"""
+    if _tooltip_win is not None:
+        try:
+            _tooltip_win.withdraw()
+        except:
+            pass
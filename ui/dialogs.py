@@ -3,7 +3,7 @@ Dialog windows for HUD Notes
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
 import os
 from datetime import datetime
@@ -11,6 +11,14 @@ from typing import Dict, Optional
 from ui.components import create_tooltip
 
 
+# Languages offered for fenced code blocks
+_CODE_LANGUAGES = (
+    'bash', 'python', 'javascript', 'java', 'c', 'cpp', 'csharp', 'go', 'rust',
+    'php', 'ruby', 'swift', 'kotlin', 'scala', 'html', 'css', 'sql', 'xml',
+    'json', 'yaml', 'markdown', 'powershell', 'dockerfile', 'typescript', 'r'
+)
+
+
 class StartupDialog:
     """Startup configuration dialog"""
     
@@ -194,6 +202,7 @@ class StartupDialog:
     
     def _browse_directory(self):
         """Browse for directory"""
+        from tkinter import filedialog
         directory = filedialog.askdirectory(initialdir=self.dir_var.get(), title="Select Notes Directory")
         if directory:
             self.dir_var.set(directory)
@@ -449,6 +458,7 @@ class TemplateSelectionDialog:
                 'content': formatted_content
             }
         else:
+            from tkinter import messagebox
             messagebox.showwarning("No Selection", "Please select a template first.")
             return
         
@@ -486,6 +496,9 @@ class TemplateSelectionDialog:
 class SettingsDialog:
     """Settings configuration dialog"""
     
+    # ttk styles are global to the Tk interpreter, so configure them once
+    _style_configured = False
+    
     def __init__(self, parent, settings, display_manager, theme_manager=None):
         self.parent = parent
         self.settings = settings
@@ -501,10 +514,27 @@ class SettingsDialog:
         self.mouse_hover_var = None
         self.click_hide_var = None
         self.tooltips_var = None
-        self.hotkey_vars = {}
+        self.hotkey_tree = None
+        
+        # Notebook tabs are populated on first selection
+        self._tab_frames = []
+        self._tabs_built = set()
     
     def show(self):
-        """Show settings dialog"""
+        """Show settings dialog
+        
+        The window is built on first use and withdrawn on close, so later
+        opens only refresh the values and deiconify it.
+        """
+        if self.window is not None and self.window.winfo_exists():
+            self._load_values()
+            self.window.deiconify()
+            self.window.attributes('-topmost', True)
+            self.window.lift()
+            self.window.focus_force()
+            self.window.grab_set()
+            return
+        
         self.window = tk.Toplevel(self.parent)
         self.window.lift()
         self.window.focus_force()
@@ -540,13 +570,39 @@ class SettingsDialog:
         self._create_ui()
         
         # Handle window close
-        self.window.protocol("WM_DELETE_WINDOW", self.window.destroy)
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
         
         # Keyboard shortcuts
         self.window.bind('<Return>', lambda e: self._apply_settings())
-        self.window.bind('<Escape>', lambda e: self.window.destroy())
-        
+        self.window.bind('<Escape>', lambda e: self._close())
+    
+    def _close(self):
+        """Hide the settings window so it can be reused"""
+        if self.window:
+            self.window.grab_release()
+            self.window.withdraw()
     
+    def _load_values(self):
+        """Refresh dialog variables from the current settings
+        
+        Tabs that have not been built yet read the settings when they are.
+        """
+        if 'colors' in self._tabs_built:
+            self.color_scheme_var.set(self.settings.get('color_scheme', 'Matrix Green'))
+            self.custom_bg_var.set(self.settings.get('bg_color', '#0a0a0a'))
+            self.custom_fg_var.set(self.settings.get('fg_color', '#00ff41'))
+            self.custom_accent_var.set(self.settings.get('accent_color', '#ff6600'))
+        
+        if 'hotkeys' in self._tabs_built:
+            current_hotkeys = self.settings.get('hotkeys', {})
+            for key in self.hotkey_tree.get_children():
+                self.hotkey_tree.set(key, 'hotkey', current_hotkeys.get(key, 'Ctrl+Alt+T'))
+        
+        if 'advanced' in self._tabs_built:
+            self.mouse_hover_var.set(self.settings.get('mouse_hover_show', False))
+            self.click_hide_var.set(self.settings.get('click_outside_hide', False))
+            self.tooltips_var.set(self.settings.get('show_tooltips', True))
+        
     def _create_ui(self):
         """Create settings UI"""
         # Main frame
@@ -568,18 +624,39 @@ class SettingsDialog:
         
         self._configure_notebook_style()
         
-        # Create tabs
-        self._create_colors_tab()
-        self._create_hotkeys_tab()
-        self._create_advanced_tab()
+        # Create empty tabs; each is populated the first time it is selected
+        for key, title, builder in (('colors', 'Colors & Theme', self._create_colors_tab),
+                                    ('hotkeys', 'Hotkeys', self._create_hotkeys_tab),
+                                    ('advanced', 'Advanced', self._create_advanced_tab)):
+            tab_frame = tk.Frame(self.notebook, bg='#1a1a1a')
+            self.notebook.add(tab_frame, text=title)
+            self._tab_frames.append((key, tab_frame, builder))
+        
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._build_tab(0)
         # Add some spacing before buttons
         spacer_frame = tk.Frame(main_frame, bg='#1a1a1a', height=10)
         spacer_frame.pack(fill=tk.X)
         # Buttons
         self._create_buttons(main_frame)
     
+    def _on_tab_changed(self, event=None):
+        """Build the newly selected tab if needed"""
+        self._build_tab(self.notebook.index('current'))
+    
+    def _build_tab(self, index):
+        """Populate a notebook tab once"""
+        key, tab_frame, builder = self._tab_frames[index]
+        if key not in self._tabs_built:
+            self._tabs_built.add(key)
+            builder(tab_frame)
+    
     def _configure_notebook_style(self):
-        """Configure notebook tab styling"""
+        """Configure notebook tab and hotkey table styling"""
+        if SettingsDialog._style_configured:
+            return
+        SettingsDialog._style_configured = True
+        
         style = ttk.Style()
         style.theme_use('clam')
         style.configure('TNotebook', background='#1a1a1a', borderwidth=0)
@@ -587,12 +664,14 @@ class SettingsDialog:
                        padding=[20, 8], borderwidth=1)
         style.map('TNotebook.Tab', background=[('selected', '#00ff41'), ('active', '#555555')],
                  foreground=[('selected', '#000000')])
+        style.configure('Treeview', background='#333333', fieldbackground='#333333',
+                       foreground='#ffffff', font=('Consolas', 10), rowheight=22)
+        style.configure('Treeview.Heading', background='#1a1a1a', foreground='#00ff41',
+                       font=('Consolas', 10, 'bold'))
+        style.map('Treeview', background=[('selected', '#0066cc')])
     
-    def _create_colors_tab(self):
+    def _create_colors_tab(self, colors_frame):
         """Create colors and theme settings tab"""
-        colors_frame = tk.Frame(self.notebook, bg='#1a1a1a')
-        self.notebook.add(colors_frame, text='Colors & Theme')
-        
         # Color schemes section
         schemes_frame = tk.LabelFrame(colors_frame, text="Color Schemes", 
                                      bg='#1a1a1a', fg='#00ff41',
@@ -648,11 +727,8 @@ class SettingsDialog:
         tk.Label(custom_frame, text="Custom color pickers would be implemented here",
                 bg='#1a1a1a', fg='#888888', font=('Consolas', 10)).pack(pady=10)
     
-    def _create_hotkeys_tab(self):
+    def _create_hotkeys_tab(self, hotkeys_frame):
         """Create hotkeys settings tab"""
-        hotkeys_frame = tk.Frame(self.notebook, bg='#1a1a1a')
-        self.notebook.add(hotkeys_frame, text='Hotkeys')
-        
         # Instructions
         instructions = tk.Label(hotkeys_frame, 
                                text="Click on a hotkey field and press your desired key combination.\n"
@@ -661,45 +737,36 @@ class SettingsDialog:
                                justify=tk.LEFT, wraplength=550)
         instructions.pack(pady=10, padx=10, anchor='w')
         
-        # Hotkeys list
-        hotkeys_list_frame = tk.Frame(hotkeys_frame, bg='#1a1a1a')
-        hotkeys_list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
+        # Hotkeys table - one widget instead of a Frame/Label/Entry/Button per row
         hotkey_descriptions = self.settings.get_hotkey_descriptions()
         current_hotkeys = self.settings.get('hotkeys', {})
         
+        self.hotkey_tree = ttk.Treeview(hotkeys_frame, columns=('hotkey',),
+                                        show='tree headings', selectmode='browse',
+                                        height=len(hotkey_descriptions))
+        self.hotkey_tree.heading('#0', text='Action', anchor='w')
+        self.hotkey_tree.heading('hotkey', text='Hotkey', anchor='w')
+        self.hotkey_tree.column('#0', width=220, stretch=True)
+        self.hotkey_tree.column('hotkey', width=200, stretch=True)
+        
         for key, description in hotkey_descriptions.items():
-            row_frame = tk.Frame(hotkeys_list_frame, bg='#1a1a1a')
-            row_frame.pack(fill=tk.X, pady=2)
-            
-            # Description
-            desc_label = tk.Label(row_frame, text=description + ":", 
-                                 bg='#1a1a1a', fg='#ffffff',
-                                 font=('Consolas', 10), width=20, anchor='w')
-            desc_label.pack(side=tk.LEFT, padx=(0, 10))
-            
-            # Hotkey entry
-            current_hotkey = current_hotkeys.get(key, 'Ctrl+Alt+T')
-            hotkey_var = tk.StringVar(value=current_hotkey)
-            self.hotkey_vars[key] = hotkey_var
-            
-            hotkey_entry = tk.Entry(row_frame, textvariable=hotkey_var,
-                                  bg='#333333', fg='#ffffff', font=('Consolas', 10),
-                                  insertbackground='#00ff41', width=20, state='readonly')
-            hotkey_entry.pack(side=tk.LEFT, padx=(0, 10))
-            
-            # Reset button
-            reset_btn = tk.Button(row_frame, text="Reset", 
-                                command=lambda k=key: self._reset_hotkey(k),
-                                bg='#555555', fg='#ffffff', font=('Consolas', 8),
-                                relief=tk.FLAT, padx=10, pady=2)
-            reset_btn.pack(side=tk.LEFT)
-    
-    def _create_advanced_tab(self):
-        """Create advanced settings tab"""
-        advanced_frame = tk.Frame(self.notebook, bg='#1a1a1a')
-        self.notebook.add(advanced_frame, text='Advanced')
+            self.hotkey_tree.insert('', tk.END, iid=key, text=description,
+                                    values=(current_hotkeys.get(key, 'Ctrl+Alt+T'),))
         
+        self.hotkey_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Reset button for the selected row
+        tk.Button(hotkeys_frame, text="Reset Selected", command=self._reset_selected_hotkey,
+                 bg='#555555', fg='#ffffff', font=('Consolas', 8),
+                 relief=tk.FLAT, padx=10, pady=2).pack(anchor='w', padx=10, pady=(0, 10))
+    
+    def _reset_selected_hotkey(self):
+        """Reset the selected hotkey row to its default"""
+        for key in self.hotkey_tree.selection():
+            self._reset_hotkey(key)
+    
+    def _create_advanced_tab(self, advanced_frame):
+        """Create advanced settings tab"""
         # Auto-show/hide settings
         autohide_frame = tk.LabelFrame(advanced_frame, text="Auto Show/Hide Features", 
                                      bg='#1a1a1a', fg='#00ff41',
@@ -770,7 +837,7 @@ class SettingsDialog:
         tk.Button(button_frame, text="Reset Defaults", command=self._reset_defaults,
                  bg='#cc6600', fg='white', **button_style).pack(side=tk.LEFT, padx=5)
         
-        tk.Button(button_frame, text="✗ Cancel", command=self.window.destroy,
+        tk.Button(button_frame, text="✗ Cancel", command=self._close,
                  bg='#660000', fg='white', **button_style).pack(side=tk.RIGHT, padx=5)
     
     def _reset_hotkey(self, key):
@@ -791,45 +858,53 @@ class SettingsDialog:
             'center_window': 'Ctrl+Alt+5',
         }
         
-        if key in self.hotkey_vars and key in default_hotkeys:
-            self.hotkey_vars[key].set(default_hotkeys[key])
+        if self.hotkey_tree.exists(key) and key in default_hotkeys:
+            self.hotkey_tree.set(key, 'hotkey', default_hotkeys[key])
     
     def _apply_settings(self):
-        """Apply settings and close dialog"""
+        """Apply settings and close dialog
+
+        Tabs that were never opened hold no edits and are left untouched.
+        """
         # Apply color scheme
-        scheme = self.color_scheme_var.get()
-        if scheme != 'Custom':
-            self.settings.apply_color_scheme(scheme)
-        else:
-            self.settings.update({
-                'color_scheme': 'Custom',
-                'bg_color': self.custom_bg_var.get(),
-                'fg_color': self.custom_fg_var.get(),
-                'accent_color': self.custom_accent_var.get()
-            })
+        if 'colors' in self._tabs_built:
+            scheme = self.color_scheme_var.get()
+            if scheme != 'Custom':
+                self.settings.apply_color_scheme(scheme)
+            else:
+                self.settings.update({
+                    'color_scheme': 'Custom',
+                    'bg_color': self.custom_bg_var.get(),
+                    'fg_color': self.custom_fg_var.get(),
+                    'accent_color': self.custom_accent_var.get()
+                })
         
         # Apply hotkeys
-        hotkeys = {}
-        for key, var in self.hotkey_vars.items():
-            hotkeys[key] = var.get()
-        self.settings.set('hotkeys', hotkeys)
+        if 'hotkeys' in self._tabs_built:
+            hotkeys = {}
+            for key in self.hotkey_tree.get_children():
+                hotkeys[key] = self.hotkey_tree.set(key, 'hotkey')
+            self.settings.set('hotkeys', hotkeys)
         
         # Apply advanced settings
-        self.settings.update({
-            'mouse_hover_show': self.mouse_hover_var.get(),
-            'click_outside_hide': self.click_hide_var.get(),
-            'show_tooltips': self.tooltips_var.get()
-        })
+        if 'advanced' in self._tabs_built:
+            self.settings.update({
+                'mouse_hover_show': self.mouse_hover_var.get(),
+                'click_outside_hide': self.click_hide_var.get(),
+                'show_tooltips': self.tooltips_var.get()
+            })
         
         self.settings.save_config()
-        self.window.destroy()
+        self._close()
     
     def _reset_defaults(self):
         """Reset all settings to defaults"""
+        from tkinter import messagebox
         if messagebox.askyesno("Reset Settings", 
                               "Reset all settings to defaults? This cannot be undone."):
             self.settings.reset_to_defaults()
-            self.window.destroy()
+            # Widgets are bound to the variables, so refreshing them is enough
+            self._load_values()
 
 
 class CodeInputDialog:
@@ -840,9 +915,40 @@ class CodeInputDialog:
         self.settings = settings
         self.result = None
         self.window = None
+        self._done = None
+        # Colours and font size the current window was built with
+        self._built_style = None
+    
+    def _style(self) -> tuple:
+        """Settings the dialog's widgets are styled from"""
+        return tuple(self.settings.get(key) for key in
+                     ('bg_color', 'fg_color', 'select_bg', 'font_size'))
     
     def show(self) -> Optional[str]:
-        """Show code input dialog"""
+        """Show code input dialog
+        
+        The window is built on first use and withdrawn on close, so later
+        opens only clear the previous input and deiconify it. It is rebuilt
+        if the colours or font size changed since it was built.
+        """
+        self.result = None
+        
+        if (self.window is not None and self.window.winfo_exists()
+                and self._built_style != self._style()):
+            self.window.destroy()
+            self.window = None
+        
+        if self.window is not None and self.window.winfo_exists():
+            self.code_text.delete(1.0, tk.END)
+            self.lang_var.set('bash')
+            self.window.deiconify()
+            self.window.attributes('-topmost', True)
+            self.window.lift()
+            self.window.focus_force()
+            self.window.grab_set()
+            self.code_text.focus()
+            return self._wait()
+        
         self.window = tk.Toplevel(self.parent)
         self.window.lift()
         self.window.focus_force()
@@ -881,6 +987,7 @@ class CodeInputDialog:
         self.window.grab_set()
         
         self._create_ui()
+        self._built_style = self._style()
         
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self._cancel)
@@ -888,12 +995,32 @@ class CodeInputDialog:
         # Keyboard shortcuts
         self.window.bind('<Control-Return>', lambda e: self._insert_code())
         self.window.bind('<Escape>', lambda e: self._cancel())
+        # Destroying the window (e.g. quitting while it is open) must also
+        # end the wait, as wait_window did
+        self.window.bind('<Destroy>', self._on_destroy)
         
-        # Wait for dialog to complete
-        self.window.wait_window()
-        
+        self._done = tk.BooleanVar(self.window, value=False)
+        return self._wait()
+    
+    def _on_destroy(self, event):
+        """End a pending _wait when the window itself is destroyed"""
+        if event.widget is self.window and self._done is not None:
+            self._done.set(True)
+    
+    def _wait(self) -> Optional[str]:
+        """Block until the dialog is closed and return its result"""
+        self._done.set(False)
+        self.window.wait_variable(self._done)
         return self.result
     
+    def _close(self):
+        """Hide the code window so it can be reused"""
+        if self.window:
+            self.window.grab_release()
+            self.window.withdraw()
+        if self._done is not None:
+            self._done.set(True)
+    
     def _create_ui(self):
         """Create code input UI"""
         main_frame = tk.Frame(self.window, bg=self.settings.get('bg_color', '#0a0a0a'))
@@ -908,14 +1035,8 @@ class CodeInputDialog:
                 fg=self.settings.get('fg_color', '#00ff41'),
                 font=('Consolas', 10, 'bold')).pack(side=tk.LEFT)
         
-        languages = [
-            'bash', 'python', 'javascript', 'java', 'c', 'cpp', 'csharp', 'go', 'rust',
-            'php', 'ruby', 'swift', 'kotlin', 'scala', 'html', 'css', 'sql', 'xml',
-            'json', 'yaml', 'markdown', 'powershell', 'dockerfile', 'typescript', 'r'
-        ]
-        
         self.lang_var = tk.StringVar(value='bash')
-        lang_dropdown = ttk.Combobox(lang_frame, textvariable=self.lang_var, values=languages,
+        lang_dropdown = ttk.Combobox(lang_frame, textvariable=self.lang_var, values=_CODE_LANGUAGES,
                                    state='readonly', width=15)
         lang_dropdown.pack(side=tk.LEFT, padx=10)
         
@@ -967,9 +1088,9 @@ class CodeInputDialog:
         if code_content:
             self.result = f"\n```{language}\n{code_content}\n```\n\n"
         
-        self.window.destroy()
+        self._close()
     
     def _cancel(self):
         """Cancel and close"""
         self.result = None
-        self.window.destroy()
\ No newline at end of file
+        self._close()
\ No newline at end of file
@@ -3,17 +3,61 @@ Main overlay window for HUD Notes - Enhanced with Theme Integration
 """
 
 import tkinter as tk
-from tkinter import filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 import os
+import re
 import sys
+import threading
+import time
 from datetime import datetime
+from html import unescape
 
 from ui.dialogs import TemplateSelectionDialog, SettingsDialog, CodeInputDialog
 from ui.components import StatusBar, HUDInterface, ScreenBorder
 from ui.themes import ThemeManager
 from features.syntax_highlighting import SyntaxHighlighter
-from ui.tab_manager import TabManager
+from ui.tab_manager import TabManager, NOTE_FILETYPES
+
+
+# Used to flatten rendered markdown into plain text for the preview pane:
+# tags are dropped and character references decoded in the same scan
+_PREVIEW_CLEAN_RE = re.compile(r'<[^>]+>|&(?:#\d+|#x[0-9a-f]+|[a-z][a-z0-9]*);', re.IGNORECASE)
+
+
+def _preview_clean(match):
+    """Replacement for _PREVIEW_CLEAN_RE matches"""
+    token = match.group(0)
+    return '' if token[0] == '<' else unescape(token)
+
+
+def _replace_changed_lines(widget, old, new):
+    """Replace the text of widget, currently holding old, with new
+    
+    Only the lines between the common leading and trailing lines are
+    deleted and re-inserted. Line indices are used rather than character
+    offsets so the result does not depend on how Tk counts characters.
+    """
+    old_lines = old.split('\n')
+    new_lines = new.split('\n')
+    # Always leave at least one line to replace on both sides
+    limit = min(len(old_lines), len(new_lines)) - 1
+    
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while (prefix + suffix < limit
+           and old_lines[-1 - suffix] == new_lines[-1 - suffix]):
+        suffix += 1
+    
+    start = f"{prefix + 1}.0"
+    if suffix:
+        widget.delete(start, f"{len(old_lines) - suffix + 1}.0")
+        middle = new_lines[prefix:len(new_lines) - suffix]
+        widget.insert(start, ''.join(line + '\n' for line in middle))
+    else:
+        widget.delete(start, 'end-1c')
+        widget.insert(start, '\n'.join(new_lines[prefix:]))
 
 
 class OverlayWindow:
@@ -38,6 +82,35 @@ class OverlayWindow:
         # State
         self.preview_frame = None
         self.preview_area = None
+        self._markdown = None  # markdown2 converter, built on first preview
+        self._preview_source = None  # Text the preview was last rendered from
+        self._preview_last_text = ""  # Text currently shown in the preview
+        self.settings_dialog = None
+        self.code_dialog = None
+        
+        # Auto-save timer and when it was last (re)scheduled
+        self._save_timer = None
+        self._save_scheduled_at = 0.0
+        self._highlight_timer = None
+        
+        # Last alpha applied to the root window
+        self._current_alpha = None
+        
+        # Status message waiting for the next idle cycle
+        self._pending_status = None
+        self._status_scheduled = False
+        
+        # Deferred HUD bar/screen border re-theme queued for idle time
+        self._theme_flush_pending = False
+        
+        # Text widget edited since the last highlight pass
+        self._highlight_widget = None
+        
+        # Last text shown in the file label
+        self._last_label_text = None
+        
+        # Font size last pushed to the widgets by _update_fonts
+        self._current_font_size = self.app.settings.get('font_size', 12)
         
         self._create_overlay()
     
@@ -47,11 +120,13 @@ class OverlayWindow:
             self.root = self.app.tk_root
         else:
             self.root = tk.Tk()
+        # Thread that owns the Tk interpreter; show()/hide() marshal onto it
+        self._tk_thread = threading.get_ident()
         self.root.withdraw()  # Start hidden
         self.root.title("HUD Notes")
         
         # Configure window
-        self.root.attributes('-alpha', 0.85)
+        self._set_alpha(0.85)
         if sys.platform.startswith('linux'):
             # On Linux/X11, overrideredirect(True) prevents the window from
             # ever receiving keyboard focus. Use 'utility' window type instead
@@ -86,7 +161,7 @@ class OverlayWindow:
         
         # Set transparency
         transparency = self.app.settings.get('hud_transparency', 0.85)
-        self.root.attributes('-alpha', transparency)
+        self._set_alpha(transparency)
         
         # Initialize syntax highlighter without a specific text widget
         self.syntax_highlighter = SyntaxHighlighter(
@@ -176,7 +251,7 @@ class OverlayWindow:
     def _on_window_click(self, event):
         """Handle clicks inside the overlay window"""
         # Tell auto_features this click was inside our window
-        if hasattr(self.app, 'auto_features') and self.app.auto_features:
+        if self.app.auto_features:
             self.app.auto_features.mark_click_inside(event)
 
         # On Windows, re-assert topmost for overrideredirect windows
@@ -192,8 +267,16 @@ class OverlayWindow:
             # Replace content of first tab
             active_tab = self.tab_manager.get_active_tab()
             if active_tab and active_tab.text_widget:
-                active_tab.text_widget.delete(1.0, tk.END)
-                active_tab.text_widget.insert(1.0, content)
+                text_widget = active_tab.text_widget
+                current = text_widget.get(1.0, 'end-1c')
+                if current != content:
+                    _replace_changed_lines(text_widget, current, content)
+                    # The overview is a starting point, not an edit - drop
+                    # the undo records the load produced and don't let it
+                    # mark the tab as modified
+                    text_widget.edit_reset()
+                    text_widget.edit_modified(False)
+                    active_tab.content = content
                 
                 if self.syntax_highlighter:
                     self.syntax_highlighter.set_text_widget(active_tab.text_widget)
@@ -203,40 +286,36 @@ class OverlayWindow:
         self.update_status("Template overview loaded")
     
     def show(self):
-        """Show the overlay - THREAD SAFE VERSION"""
+        """Show the overlay
+        
+        Calls from any thread other than the Tk one are marshalled onto it.
+        """
+        if not self.root:
+            return
         try:
-            if self.root:
-                try:
-                    self.root.deiconify()
-                    self.root.attributes('-topmost', True)
-                    self.root.lift()
-                    self.root.focus_force()
-                except RuntimeError as e:
-                    if "main thread is not in main loop" in str(e):
-                        try:
-                            self.root.after(0, self._safe_show)
-                        except Exception:
-                            pass
-                    else:
-                        raise
+            if threading.get_ident() != self._tk_thread:
+                self.root.after(0, self.show)
+                return
+            
+            self.root.deiconify()
+            self.root.attributes('-topmost', True)
+            self.root.lift()
+            self.root.focus_force()
 
             # Focus active tab
             if self.tab_manager:
                 active_text = self.tab_manager.get_active_text_widget()
                 if active_text:
-                    try:
-                        active_text.focus_set()
-                    except Exception:
-                        pass
+                    active_text.focus_set()
 
             # On Windows, re-assert topmost after a short delay to survive
             # the WM activation dance that overrideredirect windows undergo.
-            if self._using_overrideredirect and self.root:
+            if self._using_overrideredirect:
                 self.root.after(50, self._reassert_topmost)
 
             self.update_status("HUD Activated")
-        except Exception:
-            pass
+        except (RuntimeError, tk.TclError):
+            pass  # Root is being or has been destroyed
 
     def _reassert_topmost(self):
         """Re-assert topmost after show (Windows overrideredirect fix)"""
@@ -247,49 +326,24 @@ class OverlayWindow:
         except Exception:
             pass
 
-    def _safe_show(self):
-        """Safely show window in main thread"""
-        try:
-            if self.root:
-                self.root.deiconify()
-                self.root.lift()
-                self.root.focus_force()
-
-                if self.tab_manager:
-                    active_text = self.tab_manager.get_active_text_widget()
-                    if active_text:
-                        active_text.focus()
-        except Exception:
-            pass
-        self.update_status("HUD Activated")
-
     def hide(self):
-        """Hide the overlay - THREAD SAFE VERSION"""
-        try:
-            if hasattr(self.app, 'window_manager') and self.app.window_manager:
-                self.app.window_manager._save_window_geometry()
-
-            if self.root:
-                try:
-                    self.root.withdraw()
-                except RuntimeError as e:
-                    if "main thread is not in main loop" in str(e):
-                        try:
-                            self.root.after(0, self._safe_withdraw)
-                        except Exception:
-                            pass
-                    else:
-                        raise
-        except Exception:
-            pass
-
-    def _safe_withdraw(self):
-        """Safely withdraw window in main thread"""
+        """Hide the overlay
+        
+        Calls from any thread other than the Tk one are marshalled onto it.
+        """
+        if not self.root:
+            return
         try:
-            if self.root:
-                self.root.withdraw()
-        except Exception:
-            pass
+            if threading.get_ident() != self._tk_thread:
+                self.root.after(0, self.hide)
+                return
+            
+            self.root.withdraw()
+            # Record the geometry once the hide has been processed
+            if self.app.window_manager:
+                self.root.after_idle(self.app.window_manager._save_window_geometry)
+        except (RuntimeError, tk.TclError):
+            pass  # Root is being or has been destroyed
     
     def new_note(self):
         """Create a new note with template selection"""
@@ -332,11 +386,12 @@ class OverlayWindow:
     
     def open_note(self):
         """Open an existing note in new tab"""
+        from tkinter import filedialog
         self.prepare_for_dialog()
         filename = filedialog.askopenfilename(
             initialdir=self.app.notes_dir,
             title="Open Note",
-            filetypes=[("Markdown files", "*.md"), ("Text files", "*.txt"), ("All files", "*.*")]
+            filetypes=NOTE_FILETYPES
         )
         self.restore_after_dialog()
         
@@ -359,16 +414,17 @@ class OverlayWindow:
             if active_tab and active_tab.file_path:
                 self.app.set_current_file(active_tab.file_path)
                 self.update_file_label()
-                self.update_status(f"Saved: {os.path.basename(active_tab.file_path)}")
+                self.update_status(f"Saved: {active_tab.basename}")
     
     def save_as_note(self):
         """Save note with new filename"""
+        from tkinter import filedialog
         self.prepare_for_dialog()
         filename = filedialog.asksaveasfilename(
             initialdir=self.app.notes_dir,
             title="Save Note As",
             defaultextension=".md",
-            filetypes=[("Markdown files", "*.md"), ("Text files", "*.txt"), ("All files", "*.*")]
+            filetypes=NOTE_FILETYPES
         )
         self.restore_after_dialog()
 
@@ -377,15 +433,16 @@ class OverlayWindow:
             active_tab = self.tab_manager.get_active_tab()
             if active_tab:
                 active_tab.file_path = filename
-                active_tab.title = os.path.basename(filename)
+                active_tab.title = active_tab.basename
                 self.tab_manager._update_tab_title(active_tab.tab_id)
             self.app.set_current_file(filename)
             self.save_note()
     
     def open_code_window(self):
         """Open code input window with theme support"""
-        dialog = CodeInputDialog(self.root, self.app.settings)
-        result = dialog.show()
+        if self.code_dialog is None:
+            self.code_dialog = CodeInputDialog(self.root, self.app.settings)
+        result = self.code_dialog.show()
         
         if result:
             # Get active text widget instead of self.text_area
@@ -401,12 +458,12 @@ class OverlayWindow:
     
     def toggle_preview(self):
         """Toggle markdown preview with theme support"""
-        if hasattr(self, 'preview_frame') and self.preview_frame and self.preview_frame.winfo_viewable():
+        if self.preview_frame and self.preview_frame.winfo_viewable():
             self.preview_frame.pack_forget()
             # No need to repack text_area since we're using tabs
             self.update_status("Preview hidden")
         else:
-            if not hasattr(self, 'preview_frame') or not self.preview_frame:
+            if not self.preview_frame:
                 self._create_preview()
             
             # Show preview alongside tab manager
@@ -426,38 +483,45 @@ class OverlayWindow:
             font=('Arial', self.app.settings.get('font_size', 12)),
             state=tk.DISABLED,
             relief=tk.FLAT,
-            borderwidth=1
+            borderwidth=1,
+            # Read-only pane: keep no undo history for the rewrites
+            undo=False,
+            autoseparators=False,
+            maxundo=0
         )
         
         # Apply theme to preview area
-        current_theme = self.theme_manager.get_current_theme()
-        if current_theme:
-            self.preview_area.configure(
-                bg=current_theme.get_color('bg_color'),
-                fg='#cccccc'  # Use a neutral color for preview
-            )
+        self.preview_area.configure(
+            bg=self.theme_manager.colors.get('bg_color', '#000000'),
+            fg='#cccccc'  # Use a neutral color for preview
+        )
         
         self.preview_area.pack(fill=tk.BOTH, expand=True)
     
     def _update_preview(self):
         """Update markdown preview"""
-        if hasattr(self, 'preview_area') and self.preview_area and self.preview_frame.winfo_viewable():
+        if self.preview_area and self.preview_frame.winfo_viewable():
             try:
-                import markdown2
                 # Get content from active tab instead of self.text_area
                 active_text = self.tab_manager.get_active_text_widget()
                 if active_text:
-                    content = active_text.get(1.0, tk.END)
-                    html = markdown2.markdown(content, extras=['fenced-code-blocks', 'tables'])
+                    content = active_text.get(1.0, 'end-1c')
+                    if content == self._preview_source:
+                        return  # Preview already shows this text
                     
-                    import re
-                    text = re.sub(r'<[^>]+>', '', html)
-                    text = text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
+                    if self._markdown is None:
+                        import markdown2
+                        self._markdown = markdown2.Markdown(extras=['fenced-code-blocks', 'tables'])
+                    html = self._markdown.convert(content)
                     
-                    self.preview_area.config(state=tk.NORMAL)
-                    self.preview_area.delete(1.0, tk.END)
-                    self.preview_area.insert(1.0, text)
-                    self.preview_area.config(state=tk.DISABLED)
+                    text = _PREVIEW_CLEAN_RE.sub(_preview_clean, html)
+                    
+                    if text != self._preview_last_text:
+                        self.preview_area.config(state=tk.NORMAL)
+                        _replace_changed_lines(self.preview_area, self._preview_last_text, text)
+                        self.preview_area.config(state=tk.DISABLED)
+                        self._preview_last_text = text
+                    self._preview_source = content
                     
             except Exception as e:
                 print(f"Preview update error: {e}")
@@ -465,13 +529,14 @@ class OverlayWindow:
     def open_settings(self):
         """Open settings dialog with theme support"""
         self.prepare_for_dialog()
-        dialog = SettingsDialog(
-            self.root,
-            self.app.settings,
-            self.app.display_manager,
-            self.theme_manager
-        )
-        dialog.show()
+        if self.settings_dialog is None:
+            self.settings_dialog = SettingsDialog(
+                self.root,
+                self.app.settings,
+                self.app.display_manager,
+                self.theme_manager
+            )
+        self.settings_dialog.show()
         self.restore_after_dialog()
         
         # Reload theme in case it changed
@@ -484,6 +549,8 @@ class OverlayWindow:
         """Increase font size"""
         current_size = self.app.settings.get('font_size', 12)
         new_size = min(24, current_size + 1)
+        if new_size == current_size:
+            return  # Already at the maximum
         self.app.settings.set('font_size', new_size)
         self._update_fonts()
         self.update_status(f"Font size: {new_size}")
@@ -492,6 +559,8 @@ class OverlayWindow:
         """Decrease font size"""
         current_size = self.app.settings.get('font_size', 12)
         new_size = max(8, current_size - 1)
+        if new_size == current_size:
+            return  # Already at the minimum
         self.app.settings.set('font_size', new_size)
         self._update_fonts()
         self.update_status(f"Font size: {new_size}")
@@ -499,10 +568,14 @@ class OverlayWindow:
     def _update_fonts(self):
         """Update font sizes for all tabs"""
         font_size = self.app.settings.get('font_size', 12)
+        if font_size == self._current_font_size:
+            return
+        self._current_font_size = font_size
+        
         if self.tab_manager:
             self.tab_manager.update_font_size(font_size)
         
-        if hasattr(self, 'preview_area') and self.preview_area:
+        if self.preview_area:
             self.preview_area.config(font=('Arial', font_size))
         
         if self.syntax_highlighter:
@@ -513,7 +586,7 @@ class OverlayWindow:
         current = self.app.settings.get('hud_transparency', 0.85)
         new_transparency = max(0.3, current - 0.05)  # Smaller increments
         self.app.settings.set('hud_transparency', new_transparency)
-        self.root.attributes('-alpha', new_transparency)
+        self._set_alpha(new_transparency)
         self.update_status(f"Transparency: {int(new_transparency*100)}%")
         
         # Update status bar display
@@ -525,7 +598,7 @@ class OverlayWindow:
         current = self.app.settings.get('hud_transparency', 0.85)
         new_transparency = min(1.0, current + 0.05)  # Smaller increments
         self.app.settings.set('hud_transparency', new_transparency)
-        self.root.attributes('-alpha', new_transparency)
+        self._set_alpha(new_transparency)
         self.update_status(f"Transparency: {int(new_transparency*100)}%")
         
         # Update status bar display
@@ -540,64 +613,106 @@ class OverlayWindow:
             if self.tab_manager:
                 active_tab = self.tab_manager.get_active_tab()
                 if active_tab:
-                    if active_tab.file_path:
-                        filename = os.path.basename(active_tab.file_path)
-                        self.hud_interface.update_file_label(f"{filename} [{position_info}]")
+                    if active_tab.basename:
+                        text = f"{active_tab.basename} [{position_info}]"
                     else:
-                        self.hud_interface.update_file_label(f"{active_tab.title} [{position_info}]")
+                        text = f"{active_tab.title} [{position_info}]"
                 else:
-                    self.hud_interface.update_file_label(f"No tabs open [{position_info}]")
+                    text = f"No tabs open [{position_info}]"
             else:
-                self.hud_interface.update_file_label(f"Loading... [{position_info}]")
+                text = f"Loading... [{position_info}]"
+            
+            # Only touch the Tk label when the text actually changed
+            if text != self._last_label_text:
+                self._last_label_text = text
+                self.hud_interface.update_file_label(text)
 
     
     def update_status(self, message: str):
-        """Update status message"""
+        """Update status message
+        
+        Messages are applied on the next idle cycle, so several updates in
+        a row only reach the status bar once, with the last message.
+        """
         if self.status_bar:
-            self.status_bar.update_status(message)
+            self._pending_status = message
+            if not self._status_scheduled:
+                self._status_scheduled = True
+                self.root.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        """Show the latest pending status message"""
+        self._status_scheduled = False
+        if self.status_bar and self._pending_status is not None:
+            self.status_bar.update_status(self._pending_status)
+        self._pending_status = None
     
     def auto_save(self):
         """Auto-save the current tab"""
+        self._save_timer = None
         if self.tab_manager:
             active_tab = self.tab_manager.get_active_tab()
             if active_tab and active_tab.file_path and active_tab.text_widget:
-                # Update tab content from text widget
-                active_tab.content = active_tab.text_widget.get(1.0, tk.END)
-                # Save the tab
+                # Nothing typed since the last save - skip the buffer copy
+                if not active_tab.modified:
+                    return
+                # Save the tab (copies the buffer out of the widget)
                 if self.tab_manager._save_tab(active_tab):
                     self.update_status("Auto-saved")
     
     def _on_text_change(self, event=None):
         """Handle text changes with auto-save and syntax highlighting"""
-        if hasattr(self, '_save_timer'):
-            self.root.after_cancel(self._save_timer)
+        # Schedule auto-save for tabs with file paths. While typing, a timer
+        # pushed back less than 0.5 s ago is left alone instead of being
+        # cancelled and re-created on every keystroke.
+        now = time.monotonic()
+        if not (self._save_timer and now - self._save_scheduled_at < 0.5):
+            if self._save_timer:
+                self.root.after_cancel(self._save_timer)
+                self._save_timer = None
 
-        # Schedule auto-save for tabs with file paths
-        if self.tab_manager:
-            active_tab = self.tab_manager.get_active_tab()
-            if active_tab and active_tab.file_path:
-                self._save_timer = self.root.after(2000, self.auto_save)
+            if self.tab_manager:
+                active_tab = self.tab_manager.get_active_tab()
+                if active_tab and active_tab.file_path:
+                    self._save_timer = self.root.after(2000, self.auto_save)
+                    self._save_scheduled_at = now
 
-        # Schedule syntax highlighting update
-        if self.syntax_highlighter:
-            if hasattr(self, '_highlight_timer'):
+        # Highlighting and the preview catch up together once typing pauses
+        active_text = self.tab_manager.get_active_text_widget() if self.tab_manager else None
+        if active_text:
+            self._highlight_widget = active_text
+            if self._highlight_timer:
                 self.root.after_cancel(self._highlight_timer)
+            self._highlight_timer = self.root.after(150, self._flush_highlighting)
 
-            active_text = self.tab_manager.get_active_text_widget() if self.tab_manager else None
-            if active_text:
-                self.syntax_highlighter.set_text_widget(active_text)
-                self._highlight_timer = self.root.after(300,
-                                                    self.syntax_highlighter.apply_highlighting)
-
+    def _flush_highlighting(self):
+        """Re-highlight the edited text widget and refresh the preview"""
+        self._highlight_timer = None
+        text_widget, self._highlight_widget = self._highlight_widget, None
+        
+        if self.syntax_highlighter and text_widget:
+            try:
+                self.syntax_highlighter.set_text_widget(text_widget)
+                self.syntax_highlighter.apply_highlighting()
+            except tk.TclError:
+                pass  # Tab was closed before the timer fired
+        
         # Update preview if visible
-        if hasattr(self, 'preview_frame') and self.preview_frame and self.preview_frame.winfo_viewable():
+        if self.preview_frame and self.preview_frame.winfo_viewable():
             self._update_preview()
 
     
+    def _set_alpha(self, alpha):
+        """Set the window alpha, skipping the Tk call if it is unchanged"""
+        alpha = round(alpha, 3)
+        if alpha != self._current_alpha:
+            self.root.attributes('-alpha', alpha)
+            self._current_alpha = alpha
+    
     def _on_focus_in(self, event):
         """Handle focus in"""
         transparency = self.app.settings.get('hud_transparency', 0.85)
-        self.root.attributes('-alpha', min(1.0, transparency + 0.1))
+        self._set_alpha(min(1.0, transparency + 0.1))
         # On Windows, re-assert topmost to prevent z-order loss with
         # overrideredirect windows
         if self._using_overrideredirect:
@@ -618,7 +733,7 @@ class OverlayWindow:
             # focus_get() can raise KeyError for destroyed widgets
             pass
         transparency = self.app.settings.get('hud_transparency', 0.85)
-        self.root.attributes('-alpha', transparency)
+        self._set_alpha(transparency)
     
     def _apply_theme_changes(self):
         """Apply comprehensive theme changes after settings update"""
@@ -630,28 +745,35 @@ class OverlayWindow:
             self.tab_manager.apply_theme(self.theme_manager)
         
         # Update preview area if it exists
-        if hasattr(self, 'preview_area') and self.preview_area:
-            current_theme = self.theme_manager.get_current_theme()
-            if current_theme:
-                self.preview_area.configure(
-                    bg=current_theme.get_color('bg_color'),
-                    fg='#cccccc'
-                )
-        
-        # Update other components
-        if self.hud_interface:
-            self.hud_interface.apply_theme(self.theme_manager)
+        if self.preview_area:
+            self.preview_area.configure(
+                bg=self.theme_manager.colors.get('bg_color', '#000000'),
+                fg='#cccccc'
+            )
         
         if self.status_bar:
             self.status_bar.apply_theme(self.theme_manager)
         
-        # Update syntax highlighter with new theme colors
+        # Update syntax highlighter with new theme colors - a single pass,
+        # update_theme re-creates the tags and re-highlights
         if self.syntax_highlighter:
-            self.syntax_highlighter.update_theme(self.theme_manager)
             active_text = self.tab_manager.get_active_text_widget()
             if active_text:
-                self.syntax_highlighter.set_text_widget(active_text)
-                self.syntax_highlighter.apply_highlighting()
+                self.syntax_highlighter.text_widget = active_text
+            self.syntax_highlighter.update_theme(self.theme_manager)
+        
+        # The HUD bar and the screen border windows repaint large areas, so
+        # they are re-themed once at idle time, after the settings dialog
+        # has closed, however many theme changes arrive before then
+        if not self._theme_flush_pending:
+            self._theme_flush_pending = True
+            self.root.after_idle(self._flush_theme)
+    
+    def _flush_theme(self):
+        """Apply the deferred part of _apply_theme_changes"""
+        self._theme_flush_pending = False
+        if self.hud_interface:
+            self.hud_interface.apply_theme(self.theme_manager)
         
         # Update screen border colors
         if self.screen_border:
@@ -3,16 +3,26 @@ Tab management system for HUD Notes
 """
 
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import font as tkfont
 from tkinter.scrolledtext import ScrolledText
 import os
+import shutil
 import sys
+from functools import partial
 from typing import Dict, List, Optional
 
 
+# File type filters shared by the open/save dialogs
+NOTE_FILETYPES = (("Markdown files", "*.md"), ("Text files", "*.txt"), ("All files", "*.*"))
+
+
 class Tab:
     """Individual tab data"""
     
+    # Tabs are created and looked up often; no per-instance __dict__
+    __slots__ = ('tab_id', 'title', '_file_path', 'basename', 'content',
+                 'modified', 'text_widget')
+    
     def __init__(self, tab_id: int, title: str = "Untitled", file_path: str = None):
         self.tab_id = tab_id
         self.title = title
@@ -21,6 +31,17 @@ class Tab:
         self.modified = False
         self.text_widget = None
     
+    @property
+    def file_path(self) -> Optional[str]:
+        """Path the tab is saved to, if any"""
+        return self._file_path
+    
+    @file_path.setter
+    def file_path(self, value: Optional[str]):
+        self._file_path = value
+        # Cached so label refreshes don't re-split the path
+        self.basename = os.path.basename(value) if value else None
+    
     def get_display_title(self) -> str:
         """Get title for display with modification indicator"""
         title = self.title
@@ -42,6 +63,8 @@ class TabManager:
         self.theme_manager = theme_manager
         self.tabs: Dict[int, Tab] = {}
         self.active_tab_id: Optional[int] = None
+        # Tab ids, least to most recently used
+        self._tab_order: List[int] = []
         self.next_tab_id = 1
         self.untitled_counter = 1
         
@@ -50,6 +73,14 @@ class TabManager:
         self.content_frame = None
         self.tab_buttons: Dict[int, tk.Button] = {}
         
+        # Named font shared by every editor widget; resizing it updates
+        # all tabs at once
+        self._editor_font = None
+        
+        # Theme colors last applied by apply_theme; new tabs pick up the
+        # current theme when they are created
+        self._last_theme_colors = None
+        
         self._create_ui()
         
         # Create initial tab
@@ -80,16 +111,16 @@ class TabManager:
         tab_id = self.next_tab_id
         self.next_tab_id += 1
         
+        # Create tab object
+        tab = Tab(tab_id, title, file_path)
+        
         # Generate title if not provided
         if not title:
-            if file_path:
-                title = os.path.basename(file_path)
+            if tab.basename:
+                tab.title = tab.basename
             else:
-                title = f"Untitled {self.untitled_counter}"
+                tab.title = f"Untitled {self.untitled_counter}"
                 self.untitled_counter += 1
-        
-        # Create tab object
-        tab = Tab(tab_id, title, file_path)
         tab.content = content
         self.tabs[tab_id] = tab
         
@@ -106,10 +137,15 @@ class TabManager:
     
     def _create_text_widget(self, tab: Tab):
         """Create text widget for tab"""
+        if self._editor_font is None:
+            self._editor_font = tkfont.Font(
+                family='Consolas', size=self.app.settings.get('font_size', 12)
+            )
+        
         tab.text_widget = ScrolledText(
             self.content_frame,
             wrap=tk.WORD,
-            font=('Consolas', self.app.settings.get('font_size', 12)),
+            font=self._editor_font,
             relief=tk.FLAT,
             borderwidth=1,
             highlightthickness=1,
@@ -125,12 +161,15 @@ class TabManager:
         # Insert content
         if tab.content:
             tab.text_widget.insert(1.0, tab.content)
+            tab.text_widget.edit_modified(False)
         
         # Bind events
-        tab.text_widget.bind('<KeyRelease>', lambda e: self._on_text_change(tab.tab_id))
+        # <<Modified>> only fires when the buffer actually changes, unlike
+        # <KeyRelease> which also fires for arrows, modifiers and shortcuts
+        tab.text_widget.bind('<<Modified>>', partial(self._on_modified, tab.tab_id))
         
         # Setup shortcuts
-        if hasattr(self.app, 'hotkey_manager'):
+        if self.app.hotkey_manager:
             self.app.hotkey_manager.setup_text_area_shortcuts(tab.text_widget)
         
         # Hide initially
@@ -149,7 +188,7 @@ class TabManager:
         tab_btn = tk.Button(
             button_frame,
             text=tab.get_display_title(),
-            command=lambda: self.switch_to_tab(tab.tab_id),
+            command=partial(self.switch_to_tab, tab.tab_id),
             bg=btn_bg,
             fg=btn_fg,
             font=('Consolas', 9),
@@ -164,7 +203,7 @@ class TabManager:
         close_btn = tk.Button(
             button_frame,
             text="×",
-            command=lambda: self.close_tab(tab.tab_id),
+            command=partial(self.close_tab, tab.tab_id),
             bg=btn_bg,
             fg='#ff6666',
             font=('Arial', 8, 'bold'),
@@ -178,7 +217,9 @@ class TabManager:
         self.tab_buttons[tab.tab_id] = {
             'frame': button_frame,
             'tab_btn': tab_btn,
-            'close_btn': close_btn
+            'close_btn': close_btn,
+            # Text currently on tab_btn, to skip no-op title updates
+            'title': tab.get_display_title()
         }
     
     def switch_to_tab(self, tab_id: int):
@@ -210,9 +251,12 @@ class TabManager:
             self.tab_buttons[tab_id]['tab_btn'].config(bg=btn_active)
 
         self.active_tab_id = tab_id
+        if tab_id in self._tab_order:
+            self._tab_order.remove(tab_id)
+        self._tab_order.append(tab_id)
 
         # Update window title (if overlay is ready)
-        if hasattr(self.app, 'overlay') and self.app.overlay:
+        if self.app.overlay:
             self.app.overlay.update_file_label()
     
     def close_tab(self, tab_id: int):
@@ -225,9 +269,10 @@ class TabManager:
         # Check for unsaved changes
         if tab.modified:
             # Temporarily disable overrideredirect so dialogs don't freeze on Linux
-            overlay = self.app.overlay if hasattr(self.app, 'overlay') else None
+            overlay = self.app.overlay
             if overlay:
                 overlay.prepare_for_dialog()
+            from tkinter import messagebox
             response = messagebox.askyesnocancel(
                 "Unsaved Changes",
                 f"Save changes to '{tab.title}' before closing?"
@@ -235,7 +280,7 @@ class TabManager:
             if overlay:
                 overlay.restore_after_dialog()
             if response is True:  # Yes - save first
-                if not self._save_tab(tab):
+                if not self._save_tab(tab, durable=True):
                     return  # Save failed, don't close
             elif response is None:  # Cancel
                 return  # Don't close
@@ -250,6 +295,12 @@ class TabManager:
             # ScrolledText wraps the Text widget inside a container Frame
             # (text_widget.frame). Destroying only the Text leaves the
             # container Frame orphaned with a default white background.
+            # The undo stack is dropped first so its records are freed
+            # before the widget teardown.
+            try:
+                tab.text_widget.edit_reset()
+            except tk.TclError:
+                pass
             if hasattr(tab.text_widget, 'frame'):
                 tab.text_widget.frame.destroy()
             else:
@@ -257,14 +308,15 @@ class TabManager:
 
         # Remove from tabs dict
         del self.tabs[tab_id]
+        self._tab_order.remove(tab_id)
         
         # Handle active tab
         if self.active_tab_id == tab_id:
             self.active_tab_id = None
             
-            # Switch to another tab if available
-            if self.tabs:
-                self.switch_to_tab(next(iter(self.tabs.keys())))
+            # Switch to the most recently used remaining tab
+            if self._tab_order:
+                self.switch_to_tab(self._tab_order[-1])
             else:
                 # No tabs left, create a new one
                 self.create_new_tab()
@@ -280,23 +332,35 @@ class TabManager:
         active_tab = self.get_active_tab()
         return active_tab.text_widget if active_tab else None
     
+    def _on_modified(self, tab_id: int, event=None):
+        """Handle Tk's <<Modified>> event for a tab's text widget"""
+        tab = self.tabs.get(tab_id)
+        if not tab or not tab.text_widget:
+            return
+        
+        # Resetting the flag fires <<Modified>> again; that second event
+        # sees a clear flag and stops here
+        if not tab.text_widget.edit_modified():
+            return
+        # Re-arm so the next edit fires the event again
+        tab.text_widget.edit_modified(False)
+        self._on_text_change(tab_id)
+    
     def _on_text_change(self, tab_id: int):
         """Handle text changes in tab"""
         if tab_id not in self.tabs:
             return
         
         tab = self.tabs[tab_id]
+        # The buffer itself is only copied out when _save_tab needs it
         if tab.text_widget:
-            # Update content
-            tab.content = tab.text_widget.get(1.0, tk.END)
-            
             # Mark as modified
             if not tab.modified:
                 tab.set_modified(True)
                 self._update_tab_title(tab_id)
             
             # Trigger auto-save
-            if hasattr(self.app, 'overlay'):
+            if self.app.overlay:
                 self.app.overlay._on_text_change()
     
     def _update_tab_title(self, tab_id: int):
@@ -304,12 +368,21 @@ class TabManager:
         if tab_id not in self.tabs or tab_id not in self.tab_buttons:
             return
         
-        tab = self.tabs[tab_id]
-        self.tab_buttons[tab_id]['tab_btn'].config(text=tab.get_display_title())
+        title = self.tabs[tab_id].get_display_title()
+        buttons = self.tab_buttons[tab_id]
+        if title != buttons['title']:
+            buttons['title'] = title
+            buttons['tab_btn'].config(text=title)
     
-    def _save_tab(self, tab: Tab) -> bool:
-        """Save tab content"""
-        overlay = self.app.overlay if hasattr(self.app, 'overlay') else None
+    def _save_tab(self, tab: Tab, durable: bool = False) -> bool:
+        """Save tab content
+        
+        The note is written to a temporary file that then replaces the
+        original, so an interrupted write never truncates it. With durable
+        set (explicit saves) the data is also flushed to disk first;
+        auto-saves leave that to the OS.
+        """
+        overlay = self.app.overlay
         if not tab.file_path:
             # Need to choose file path
             from tkinter import filedialog
@@ -319,26 +392,45 @@ class TabManager:
                 initialdir=self.app.notes_dir,
                 title="Save Note As",
                 defaultextension=".md",
-                filetypes=[("Markdown files", "*.md"), ("Text files", "*.txt"), ("All files", "*.*")]
+                filetypes=NOTE_FILETYPES
             )
             if overlay:
                 overlay.restore_after_dialog()
             if not filename:
                 return False
             tab.file_path = filename
-            tab.title = os.path.basename(filename)
+            tab.title = tab.basename
 
-        # Save content
+        # Save content. The buffer is always copied out: an edit made in the
+        # same callback may not have fired <<Modified>> (and set
+        # tab.modified) yet.
+        if tab.text_widget:
+            tab.content = tab.text_widget.get(1.0, 'end-1c')
+        # Replace the file a symlinked note points at, not the link itself
+        target = os.path.realpath(tab.file_path)
+        tmp_path = target + '.tmp'
         try:
-            with open(tab.file_path, 'w', encoding='utf-8') as f:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 f.write(tab.content)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            # The new file would otherwise get default permissions
+            if os.path.exists(target):
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
 
             tab.set_modified(False)
             self._update_tab_title(tab.tab_id)
             return True
         except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             if overlay:
                 overlay.prepare_for_dialog()
+            from tkinter import messagebox
             messagebox.showerror("Error", f"Could not save file: {e}")
             if overlay:
                 overlay.restore_after_dialog()
@@ -348,10 +440,7 @@ class TabManager:
         """Save currently active tab"""
         active_tab = self.get_active_tab()
         if active_tab:
-            # Update content from text widget
-            if active_tab.text_widget:
-                active_tab.content = active_tab.text_widget.get(1.0, tk.END)
-            return self._save_tab(active_tab)
+            return self._save_tab(active_tab, durable=True)
         return False
     
     def open_file_in_new_tab(self, file_path: str):
@@ -360,26 +449,32 @@ class TabManager:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            title = os.path.basename(file_path)
-            self.create_new_tab(title=title, content=content, file_path=file_path)
+            # The tab is titled after its file
+            self.create_new_tab(content=content, file_path=file_path)
             
         except Exception as e:
-            overlay = self.app.overlay if hasattr(self.app, 'overlay') else None
+            overlay = self.app.overlay
             if overlay:
                 overlay.prepare_for_dialog()
+            from tkinter import messagebox
             messagebox.showerror("Error", f"Could not open file: {e}")
             if overlay:
                 overlay.restore_after_dialog()
     
     def update_font_size(self, font_size: int):
         """Update font size for all tabs"""
-        for tab in self.tabs.values():
-            if tab.text_widget:
-                tab.text_widget.config(font=('Consolas', font_size))
+        # Every editor widget uses the named font, so Tk re-lays them all out
+        if self._editor_font is not None:
+            self._editor_font.configure(size=font_size)
     
     def apply_theme(self, theme_manager):
         """Apply theme to all tabs"""
         self.theme_manager = theme_manager
+        # Settings can be closed without changing the theme - nothing to do
+        if theme_manager.colors == self._last_theme_colors:
+            return
+        self._last_theme_colors = dict(theme_manager.colors)
+        
         for tab in self.tabs.values():
             if tab.text_widget:
                 theme_manager.apply_theme_to_text_widget(tab.text_widget)
@@ -396,21 +491,24 @@ class TabManager:
             fg_color = theme.get_color('fg_color', '#ffffff')
 
             for tab_id, buttons in self.tab_buttons.items():
-                buttons['tab_btn'].config(bg=btn_bg, fg=fg_color)
+                # Highlight active tab
+                bg = btn_active if tab_id == self.active_tab_id else btn_bg
+                buttons['tab_btn'].config(bg=bg, fg=fg_color)
                 buttons['close_btn'].config(bg=btn_bg)
                 buttons['frame'].config(bg=tab_bg)
-
-                # Highlight active tab
-                if tab_id == self.active_tab_id:
-                    buttons['tab_btn'].config(bg=btn_active)
     
     def cleanup(self):
         """Clean up resources"""
         for tab in self.tabs.values():
             if tab.text_widget:
+                try:
+                    tab.text_widget.edit_reset()
+                except tk.TclError:
+                    pass
                 if hasattr(tab.text_widget, 'frame'):
                     tab.text_widget.frame.destroy()
                 else:
                     tab.text_widget.destroy()
         self.tabs.clear()
+        self._tab_order.clear()
         self.tab_buttons.clear()
\ No newline at end of file
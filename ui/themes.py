@@ -53,6 +53,9 @@ class ThemeManager:
         self.settings = settings
         self.themes = {}
         self.current_theme = None
+        # Flat copy of the active theme's colors for cheap lookups on
+        # re-theme paths; kept in sync by _set_current_theme
+        self.colors = {}
         self._initialize_built_in_themes()
         self._load_current_theme()
     
@@ -275,7 +278,12 @@ class ThemeManager:
         if theme_name == 'Custom':
             self._create_custom_theme()
         else:
-            self.current_theme = self.themes.get(theme_name, self.themes['Matrix Green'])
+            self._set_current_theme(self.themes.get(theme_name, self.themes['Matrix Green']))
+    
+    def _set_current_theme(self, theme: Theme):
+        """Make theme the active one and refresh the flat color dict"""
+        self.current_theme = theme
+        self.colors = dict(theme.colors)
     
     def _create_custom_theme(self):
         """Create custom theme from settings"""
@@ -295,11 +303,11 @@ class ThemeManager:
             'success_color': '#44ff44'
         }
         
-        self.current_theme = Theme(
+        self._set_current_theme(Theme(
             name='Custom',
             colors=custom_colors,
             description='User-defined custom theme'
-        )
+        ))
     
     def get_available_themes(self) -> List[str]:
         """Get list of available theme names"""
@@ -316,7 +324,7 @@ class ThemeManager:
     def set_theme(self, theme_name: str):
         """Set active theme"""
         if theme_name in self.themes:
-            self.current_theme = self.themes[theme_name]
+            self._set_current_theme(self.themes[theme_name])
             self._update_settings_from_theme()
         elif theme_name == 'Custom':
             self._create_custom_theme()
@@ -344,7 +352,11 @@ class ThemeManager:
         
         try:
             if window_type == "main":
-                window.configure(bg=self.current_theme.get_color('bg_color'))
+                bg_color = self.current_theme.get_color('bg_color')
+                window.configure(bg=bg_color)
+                # Frames created later (tab containers, preview) pick this up
+                # from the option database without a configure each
+                window.option_add('*Frame.background', bg_color)
             elif window_type == "dialog":
                 window.configure(bg=self.current_theme.get_color('bg_color'))
             elif window_type == "title":
@@ -8,16 +8,60 @@ from tkinter import font
 from typing import Dict, List, Tuple
 
 
+def _read_is_wsl():
+    """Check /proc/version for a WSL kernel"""
+    try:
+        with open('/proc/version', 'r') as f:
+            return 'microsoft' in f.read().lower()
+    except:
+        return False
+
+
+# The platform can't change while the process runs, so it is checked once
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM == 'windows'
+_IS_LINUX = _SYSTEM == 'linux'
+_IS_WSL = _IS_LINUX and _read_is_wsl()
+
+
+# Corner position formulas:
+# (display_x, display_y, display_width, display_height, margin, width, height) -> (x, y)
+CORNER_POSITIONS = {
+    'top-left': lambda dx, dy, dw, dh, m, w, h: (dx + m, dy + m),
+    'top-right': lambda dx, dy, dw, dh, m, w, h: (dx + dw - w - m, dy + m),
+    'bottom-left': lambda dx, dy, dw, dh, m, w, h: (dx + m, dy + dh - h - 80),
+    'bottom-right': lambda dx, dy, dw, dh, m, w, h: (dx + dw - w - m, dy + dh - h - 80),
+}
+
+
 class DisplayManager:
     """Manages display detection, DPI scaling, and window positioning"""
 
     def __init__(self):
+        # Must happen before any Tk root exists so the first measurement
+        # is in physical pixels
+        PlatformManager.set_dpi_awareness()
+        
         self.screen_width = 1920
         self.screen_height = 1080
         self.dpi_scale = 1.0
         self.system_font_size = 9
         self.displays = []
         self.current_display = 0
+        # (x, y, width, height) of the current display, refreshed whenever
+        # the display list or current display changes
+        self._current_display_geom = (0, 0, self.screen_width, self.screen_height)
+        # get_scaled_dimension results for the current DPI scale
+        self._scaled_cache = {}
+        # DPI-derived sizes and per-display quarter-screen layouts, built on
+        # first use and dropped by invalidate() when the metrics change
+        self._metrics_cache = None
+        self._layout_cache = {}
+        # (screen width, screen height, raw DPI) at the last detection, and
+        # the root whose <Configure> events re-check it
+        self._last_probe = None
+        self._watched_root = None
+        self._probe_scheduled = False
         self._detected = False
     
     def detect_from_root(self, root):
@@ -32,7 +76,7 @@ class DisplayManager:
 
             try:
                 dpi_x = root.winfo_fpixels('1i')
-                self.dpi_scale = dpi_x / 96.0
+                self.dpi_scale = self._snap_dpi_scale(dpi_x / 96.0)
             except:
                 self.dpi_scale = 1.0
 
@@ -57,37 +101,104 @@ class DisplayManager:
         if not self.system_font_size or self.system_font_size <= 0:
             self.system_font_size = 9
 
+        self.invalidate()
+        self._last_probe = self._probe_dims(root)
+        if self._watched_root is not root:
+            self._watched_root = root
+            root.bind('<Configure>', self._on_root_configure, add='+')
         self._detected = True
         print(f"Display settings: {self.screen_width}x{self.screen_height}, DPI scale: {self.dpi_scale}")
     
+    @staticmethod
+    def _probe_dims(root):
+        """Cheap snapshot of what detect_from_root measures"""
+        try:
+            return (root.winfo_screenwidth(), root.winfo_screenheight(),
+                    root.winfo_fpixels('1i'))
+        except Exception:
+            return None
+    
+    def _on_root_configure(self, event):
+        """Re-check the screen once per burst of root moves/resizes"""
+        root = self._watched_root
+        if event.widget is not root or self._probe_scheduled:
+            return
+        self._probe_scheduled = True
+        root.after_idle(self._check_screen_changed)
+    
+    def _check_screen_changed(self):
+        """Re-detect only when the screen size or DPI actually changed"""
+        self._probe_scheduled = False
+        root = self._watched_root
+        probe = self._probe_dims(root)
+        if probe is not None and probe != self._last_probe:
+            self.detect_from_root(root)
+    
+    @staticmethod
+    def _snap_dpi_scale(raw_scale: float) -> float:
+        """Round a measured DPI scale to the nearest quarter step
+        
+        X11 derives DPI from the physical size the monitor reports, which
+        routinely gives 91-97 DPI on what is really a 96 DPI (1.0) screen.
+        Desktop scale factors come in 25% steps, so snapping to those stops
+        every scaled dimension from being off by a pixel.
+        """
+        return max(0.25, round(raw_scale * 4) / 4)
+    
     def _detect_displays(self):
         """Detect available displays/monitors"""
-        self.displays = []
         self.current_display = 0
+        self._layout_cache.clear()
         
-        try:
-            # Simple approach - assume single display for now
-            # In production, you might want to use platform-specific libraries
-            self.displays = [
-                {
-                    'x': 0, 
-                    'y': 0, 
-                    'width': self.screen_width, 
-                    'height': self.screen_height,
-                    'name': 'Primary Display'
-                }
-            ]
-        except:
-            # Fallback
-            self.displays = [
-                {
-                    'x': 0, 
-                    'y': 0, 
-                    'width': self.screen_width, 
-                    'height': self.screen_height,
-                    'name': 'Primary Display'
-                }
-            ]
+        # Simple approach - assume single display for now
+        # In production, you might want to use platform-specific libraries
+        self.displays = [
+            {
+                'x': 0, 
+                'y': 0, 
+                'width': self.screen_width, 
+                'height': self.screen_height,
+                'name': 'Primary Display'
+            }
+        ]
+        self._update_display_geom()
+    
+    def invalidate(self):
+        """Drop everything derived from the screen size, DPI or displays"""
+        self._scaled_cache.clear()
+        self._metrics_cache = None
+        self._layout_cache.clear()
+    
+    def _get_metrics(self) -> Dict:
+        """DPI-derived sizes, computed once per detection
+        
+        Font sizes are in points, which Tk already converts using the
+        display DPI, so only pixel sizes are multiplied by dpi_scale.
+        """
+        metrics = self._metrics_cache
+        if metrics is None:
+            dpi_scale = self.dpi_scale or 1.0
+            hotkey_height = max(20, int(30 * dpi_scale))
+            metrics = self._metrics_cache = {
+                'scaled_font_size': max(8, self.system_font_size),
+                'border': {
+                    'width': self.get_scaled_dimension(2),
+                    'screen_width': self.screen_width,
+                    'screen_height': self.screen_height
+                },
+                'hotkey_bar': {
+                    'height': hotkey_height,
+                    'font_size': 9,
+                    'y_position': (self.screen_height or 1080) - hotkey_height,
+                    'width': self.screen_width or 1920
+                },
+            }
+        return metrics
+    
+    def _update_display_geom(self):
+        """Refresh the cached geometry tuple of the current display"""
+        d = self.get_current_display()
+        self._current_display_geom = (d['x'], d['y'], d['width'], d['height'])
     
     def get_display_info(self) -> Dict:
         """Get current display information"""
@@ -116,6 +227,7 @@ class DisplayManager:
         """Set the current display"""
         if 0 <= display_index < len(self.displays):
             self.current_display = display_index
+            self._update_display_geom()
     
     def get_next_display_index(self) -> int:
         """Get the next display index (circular)"""
@@ -123,6 +235,13 @@ class DisplayManager:
     
     def get_quarter_screen_layout(self) -> Dict:
         """Calculate window layout for right 1/4 of current display"""
+        layout = self._layout_cache.get(self.current_display)
+        if layout is None:
+            layout = self._layout_cache[self.current_display] = self._compute_quarter_screen_layout()
+        return dict(layout)
+    
+    def _compute_quarter_screen_layout(self) -> Dict:
+        """Right 1/4 of the current display, below any taskbar/hotkey bar"""
         current_display = self.get_current_display()
         
         taskbar_height = 40
@@ -146,49 +265,44 @@ class DisplayManager:
         }
     
     def get_scaled_font_size(self) -> int:
-        """Get font size scaled for current DPI"""
-        return max(8, int(self.system_font_size * self.dpi_scale))
+        """Get the default font size in points (Tk scales it for DPI)"""
+        return self._get_metrics()['scaled_font_size']
     
     def get_scaled_dimension(self, base_size: int) -> int:
         """Get dimension scaled for current DPI"""
-        return max(1, int(base_size * self.dpi_scale))
+        scaled = self._scaled_cache.get(base_size)
+        if scaled is None:
+            scaled = self._scaled_cache[base_size] = max(1, int(base_size * self.dpi_scale))
+        return scaled
     
     def get_window_bounds(self, x: int, y: int, width: int, height: int) -> Tuple[int, int]:
         """Ensure window stays within screen bounds"""
-        max_x = max(0, min(x, self.screen_width - width))
-        max_y = max(0, min(y, self.screen_height - height - 50))  # Account for taskbar
-        return max_x, max_y
+        # Plain comparisons rather than max(0, min(...)) - this runs for
+        # every corner/center placement
+        limit_x = self.screen_width - width
+        limit_y = self.screen_height - height - 50  # Account for taskbar
+        if x > limit_x:
+            x = limit_x
+        if y > limit_y:
+            y = limit_y
+        return (x if x > 0 else 0), (y if y > 0 else 0)
     
     def get_center_position(self, width: int, height: int) -> Tuple[int, int]:
         """Get center position for given window size on current display"""
-        current_display = self.get_current_display()
+        dx, dy, dw, dh = self._current_display_geom
         
-        x = current_display['x'] + (current_display['width'] - width) // 2
-        y = current_display['y'] + (current_display['height'] - height) // 2
+        x = dx + (dw - width) // 2
+        y = dy + (dh - height) // 2
         
         return self.get_window_bounds(x, y, width, height)
     
     def get_corner_position(self, position: str, width: int, height: int, margin: int = 20) -> Tuple[int, int]:
         """Get corner position for given window size"""
-        current_display = self.get_current_display()
         margin = self.get_scaled_dimension(margin)
         
-        if position == 'top-left':
-            x = current_display['x'] + margin
-            y = current_display['y'] + margin
-        elif position == 'top-right':
-            x = current_display['x'] + current_display['width'] - width - margin
-            y = current_display['y'] + margin
-        elif position == 'bottom-left':
-            x = current_display['x'] + margin
-            y = current_display['y'] + current_display['height'] - height - 80
-        elif position == 'bottom-right':
-            x = current_display['x'] + current_display['width'] - width - margin
-            y = current_display['y'] + current_display['height'] - height - 80
-        else:
-            # Default to top-left
-            x = current_display['x'] + margin
-            y = current_display['y'] + margin
+        # Unknown positions default to top-left
+        corner = CORNER_POSITIONS.get(position, CORNER_POSITIONS['top-left'])
+        x, y = corner(*self._current_display_geom, margin, width, height)
         
         return self.get_window_bounds(x, y, width, height)
     
@@ -202,28 +316,11 @@ class DisplayManager:
     
     def get_border_dimensions(self) -> Dict:
         """Get dimensions for screen borders"""
-        border_width = self.get_scaled_dimension(2)
-        return {
-            'width': border_width,
-            'screen_width': self.screen_width,
-            'screen_height': self.screen_height
-        }
+        return dict(self._get_metrics()['border'])
     
     def get_hotkey_bar_dimensions(self) -> Dict:
         """Get dimensions for hotkey display bar"""
-        screen_width = self.screen_width or 1920
-        screen_height = self.screen_height or 1080
-        dpi_scale = self.dpi_scale or 1.0
-        
-        hotkey_height = max(20, int(30 * dpi_scale))
-        font_size = max(8, int(9 * dpi_scale))
-        
-        return {
-            'height': hotkey_height,
-            'font_size': font_size,
-            'y_position': screen_height - hotkey_height,
-            'width': screen_width
-        }
+        return dict(self._get_metrics()['hotkey_bar'])
         
     def calculate_dialog_size(self, base_width: int, base_height: int, content_items: int = 0) -> tuple:
         """Calculate appropriate dialog size based on DPI and content"""
@@ -267,21 +364,43 @@ class PlatformManager:
     @staticmethod
     def is_windows():
         """Check if running on Windows"""
-        return platform.system().lower() == 'windows'
+        return _IS_WINDOWS
     
     @staticmethod
     def is_linux():
         """Check if running on Linux/WSL"""
-        return platform.system().lower() == 'linux'
+        return _IS_LINUX
     
     @staticmethod
     def is_wsl():
         """Check if running in WSL"""
+        return _IS_WSL
+    
+    @staticmethod
+    def set_dpi_awareness():
+        """Opt out of DPI virtualization on Windows
+        
+        Without this, Windows reports scaled-down screen sizes and a 96 DPI
+        display to Tk on HiDPI monitors and bitmap-stretches the window.
+        """
+        if not _IS_WINDOWS:
+            return
+        
+        import ctypes
         try:
-            with open('/proc/version', 'r') as f:
-                return 'microsoft' in f.read().lower()
-        except:
-            return False
+            # Windows 10 1703+: per-monitor v2
+            if ctypes.windll.user32.SetProcessDpiAwarenessContext(ctypes.c_void_p(-4)):
+                return
+        except (AttributeError, OSError):
+            pass
+        try:
+            # Windows 8.1+: PROCESS_SYSTEM_DPI_AWARE
+            ctypes.windll.shcore.SetProcessDpiAwareness(1)
+        except (AttributeError, OSError):
+            try:
+                ctypes.windll.user32.SetProcessDPIAware()
+            except (AttributeError, OSError):
+                pass
     
     @staticmethod
     def apply_transparency(window, alpha_value=0.8):
@@ -304,7 +423,7 @@ class PlatformManager:
         for attr, value in attributes.items():
             if attr == 'transparentcolor':
                 # Only apply on Windows
-                if PlatformManager.is_windows():
+                if _IS_WINDOWS:
                     safe_attributes['-transparentcolor'] = value
             elif attr == 'alpha':
                 safe_attributes['-alpha'] = value
@@ -3,9 +3,16 @@ File operations for HUD Notes
 """
 
 import os
+import re
+import shutil
 from typing import Optional
 
 
+# Anything other than letters, digits, '_', ' ' and '-'. \w covers exactly
+# the str.isalnum() characters plus '_'.
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w \-]')
+
+
 class FileManager:
     """Handles file I/O operations"""
     
@@ -15,6 +22,8 @@ class FileManager:
         
         # Ensure notes directory exists
         os.makedirs(notes_dir, exist_ok=True)
+        # Directories already known to exist, so write_file can skip makedirs
+        self._known_dirs = {notes_dir}
     
     def read_file(self, file_path: str) -> Optional[str]:
         """Read content from file"""
@@ -29,7 +38,10 @@ class FileManager:
         """Write content to file"""
         try:
             # Ensure directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            directory = os.path.dirname(file_path)
+            if directory and directory not in self._known_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._known_dirs.add(directory)
             
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
@@ -45,36 +57,48 @@ class FileManager:
     def get_file_list(self, extension: str = None) -> list:
         """Get list of files in notes directory"""
         try:
-            files = []
-            for file in os.listdir(self.notes_dir):
-                if extension:
-                    if file.endswith(extension):
-                        files.append(os.path.join(self.notes_dir, file))
-                else:
-                    files.append(os.path.join(self.notes_dir, file))
-            return sorted(files)
+            # scandir hands back the joined path from the directory read
+            # itself, so no per-file join is needed
+            with os.scandir(self.notes_dir) as entries:
+                files = [entry.path for entry in entries
+                         if not extension or entry.name.endswith(extension)]
+            files.sort()
+            return files
         except Exception as e:
             print(f"Error listing files: {e}")
             return []
     
     def get_safe_filename(self, title: str) -> str:
         """Generate safe filename from title"""
-        safe_chars = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_'))
-        return safe_chars.strip()
+        return _UNSAFE_FILENAME_RE.sub('', title).strip()
     
     def auto_save_file(self, file_path: str, content: str) -> bool:
-        """Auto-save file with backup"""
+        """Auto-save file with backup
+        
+        The new content is written to a temporary file, the current file is
+        copied to the backup, and the temporary file is renamed over the
+        current one. file_path exists with complete content throughout.
+        """
+        # Replace the file a symlinked note points at, not the link itself
+        target = os.path.realpath(file_path)
+        tmp_path = target + '.tmp'
         try:
-            # Create backup first
-            backup_path = file_path + '.backup'
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as src:
-                    with open(backup_path, 'w', encoding='utf-8') as dst:
-                        dst.write(src.read())
-            
             # Write new content
-            return self.write_file(file_path, content)
+            if not self.write_file(tmp_path, content):
+                return False
+            
+            if os.path.exists(target):
+                shutil.copy2(target, file_path + '.backup')
+                # The new file would otherwise get default permissions
+                shutil.copymode(target, tmp_path)
+            
+            os.replace(tmp_path, target)
+            return True
             
         except Exception as e:
             print(f"Error auto-saving file {file_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False
\ No newline at end of file